@@ -15,7 +15,10 @@ from cedargrove_palettefader.palettefader import PaletteFader
 from weatherkit_to_weathmap_icon import kit_to_map_icon
 
 # AIO Weather Receiver Parameters
+WEATHER_GROUP = "default"  # AIO group containing the weather feeds
+SHOP_GROUP = "shop"  # AIO group containing the workshop sensor feeds
 SAMPLE_INTERVAL = 1200  # seconds; 20 minutes
+SAMPLE_INTERVAL_NS = SAMPLE_INTERVAL * 1000000000  # nanoseconds
 BRIGHTNESS = 0.1
 
 # Instantiate matrix display
@@ -90,55 +93,77 @@ mp.add_text(
 )
 mp.set_text(".", 4)
 
-
-def get_last_value(feed_key):
-    """Fetch the latest value of the AIO feed.
-    :param str feed_key: The AIO feed key."""
-    try:
-        # print(f"throttle limit: {mp.network.io_client.get_remaining_throttle_limit()}")
-        while mp.network.io_client.get_remaining_throttle_limit() <= 10:
-            time.sleep(1)  # Wait until throttle limit increases
-        last_value = mp.network.io_client.receive_data(feed_key)["value"]
-        return last_value
-    except Exception as e:
-        print(f"Error fetching data from feed {feed_key}: {e}")
+last_icon = None  # The currently displayed weather icon file name
+last_values = {}  # The most recently fetched feed values of each group
+
+
+def get_group_values(group_key):
+    """Fetch the latest values of all feeds in an AIO group with a single
+    request. Returns a dictionary of last values keyed by feed key. If the AIO
+    throttle limit is still reached after a single wait or the fetch fails,
+    the previously fetched values are returned. Until values have been fetched,
+    waits with a doubling delay (up to 240 seconds) and tries again.
+    :param str group_key: The AIO group key. No default."""
+    delay = 30
+    while True:
+        try:
+            # print(f"throttle limit: {mp.network.io_client.get_remaining_throttle_limit()}")
+            if mp.network.io_client.get_remaining_throttle_limit() > 10:
+                group = mp.network.io_client.get_group(group_key)
+                last_values[group_key] = {
+                    feed["key"]: feed["last_value"] for feed in group["feeds"]
+                }
+                return last_values[group_key]
+            print(f"Throttle limit reached fetching group {group_key}")
+            if group_key in last_values and delay > 30:
+                print(f"  using previous {group_key} values")
+                return last_values[group_key]
+        except Exception as e:
+            print(f"Error fetching data from group {group_key}: {e}")
+            if group_key in last_values:
+                return last_values[group_key]
+        time.sleep(delay)  # Wait for the throttle limit to increase
+        delay = min(delay * 2, 240)
+
+
+def round_value(value):
+    """Convert a numeric AIO feed value string to the nearest integer.
+    :param str value: The feed value. No default."""
+    return round(float(value))
+
+
+def progress_bar_x(elapsed_ns):
+    """Calculate the progress bar position (0 to 32 pixels) from the time
+    elapsed since the last weather update. Uses integer math.
+    :param int elapsed_ns: Nanoseconds since the last weather update. No default."""
+    return (32 * elapsed_ns) // SAMPLE_INTERVAL_NS
 
 
 def update_display():
     """Fetch last values and update the display."""
-    temperature = get_last_value("weather-temperature")
-    temperature = f"{int(round(float(temperature), 0))} F"
+    global last_icon
+    # One request per AIO group rather than one per feed
+    weather = get_group_values(WEATHER_GROUP)
+    shop = get_group_values(SHOP_GROUP)
 
-    humidity = get_last_value("weather-humidity")
-    humidity = f"{int(round(float(humidity), 0))}%"
+    temperature = f"{round_value(weather['weather-temperature'])} F"
+    humidity = f"{round_value(weather['weather-humidity'])}%"
 
-    condition = get_last_value("weather-description")
-    try:
-        current_condition = kit_to_map_icon[condition][0]
-    except:
-        current_condition = "unknown"  # If condition is not in translator
+    condition = weather["weather-description"]
+    condition_entry = kit_to_map_icon.get(condition)  # None if not in translator
 
-    daylight = get_last_value("weather-daylight")
-    if daylight == "True":
+    if weather["weather-daylight"] == "True":
         icon_suffix = "d"
     else:
         icon_suffix = "n"
 
-    wind_speed = get_last_value("weather-windspeed")
-    wind_speed = f"{int(round(float(wind_speed), 0))}"
-
-    wind_dir = get_last_value("weather-winddirection")
-
-    wind_gusts = get_last_value("weather-windgusts")
-    wind_gusts = f"{int(round(float(wind_gusts), 0))}"
-
+    wind_speed = f"{round_value(weather['weather-windspeed'])}"
+    wind_dir = weather["weather-winddirection"]
+    wind_gusts = f"{round_value(weather['weather-windgusts'])}"
     wind = f"{wind_dir} {wind_speed}"
 
-    shop_temperature = get_last_value("shop.int-temperature")
-    shop_temperature = f"{int(round(float(shop_temperature), 0))}"
-
-    shop_humidity = get_last_value("shop.int-humidity")
-    shop_humidity = f"{int(round(float(shop_humidity), 0))}"
+    shop_temperature = f"{round_value(shop['shop.int-temperature'])}"
+    shop_humidity = f"{round_value(shop['shop.int-humidity'])}"
 
     # Get the local time and provide hour-of-day for is_daytime method
     try:
@@ -149,9 +174,11 @@ def update_display():
         print(f"Error fetching local time: {e}")
 
     # Create icon file name
-    if current_condition != "unknown":
-        icon = f"index_{kit_to_map_icon[condition][2]:02d}{icon_suffix}.bmp"
+    if condition_entry is not None:
+        current_condition = condition_entry[0]
+        icon = f"index_{condition_entry[2]:02d}{icon_suffix}.bmp"
     else:
+        current_condition = "unknown"  # If condition is not in translator
         icon = "index_08d.bmp"  # Default icon if condition not in translator
     print(f"Icon filename: {icon}")
 
@@ -160,38 +187,46 @@ def update_display():
     mp.set_text(wind, 2)
     mp.set_text(f"{current_condition} Gusts:{wind_gusts} Shop:{shop_temperature}/{shop_humidity}%", 3)
 
-    mp.set_background(f"images/{icon}", (65, 65))
-    mp.graphics._bg_sprite.pixel_shader.make_transparent(0)
-    icon_normal = PaletteFader(
-        mp.graphics._bg_sprite.pixel_shader,
-        BRIGHTNESS,
-        gamma=1.0,
-        normalize=True,
-    )
-    mp.graphics._bg_sprite.pixel_shader = icon_normal.palette
-    mp.graphics._bg_sprite.x = 8
-    mp.graphics._bg_sprite.y = 12
-
+    # Load and dim the icon only when it has changed
+    if icon != last_icon:
+        mp.set_background(f"images/{icon}", (65, 65))
+        mp.graphics._bg_sprite.pixel_shader.make_transparent(0)
+        icon_normal = PaletteFader(
+            mp.graphics._bg_sprite.pixel_shader,
+            BRIGHTNESS,
+            gamma=1.0,
+            normalize=True,
+        )
+        mp.graphics._bg_sprite.pixel_shader = icon_normal.palette
+        mp.graphics._bg_sprite.x = 8
+        mp.graphics._bg_sprite.y = 12
+        last_icon = icon
+
+# Bind the progress bar label properties and colors for the main loop
+prog_bar_text = mp._text[4]
+prog_bar_colors = (label_colors.palette[5], label_colors.palette[4])  # green, red
 old_prog_bar_x = -1
-last_weather_update = time.monotonic()
+old_prog_bar_hot = None
+last_weather_update = time.monotonic_ns()
 update_display()
 
 # Main loop
 while True:
-    current_time = time.monotonic()
+    current_time = time.monotonic_ns()
 
     # Update weather every SAMPLE_INTERVAL seconds
-    if current_time - last_weather_update > SAMPLE_INTERVAL:
+    if current_time - last_weather_update > SAMPLE_INTERVAL_NS:
         update_display()
         last_weather_update = current_time
 
-    prog_bar_x = int(round(32 * (current_time - last_weather_update) / SAMPLE_INTERVAL, 0))
+    prog_bar_x = progress_bar_x(current_time - last_weather_update)
     if prog_bar_x != old_prog_bar_x:
-        if prog_bar_x > 25:
-            mp._text[4]["color"] = label_colors.palette[4]
-        else:
-            mp._text[4]["color"] = label_colors.palette[5]
-        mp._text[4]["position"] = ((prog_bar_x, 61))
+        # Change the color only when crossing the threshold
+        prog_bar_hot = prog_bar_x > 25
+        if prog_bar_hot != old_prog_bar_hot:
+            prog_bar_text["color"] = prog_bar_colors[prog_bar_hot]
+            old_prog_bar_hot = prog_bar_hot
+        prog_bar_text["position"] = (prog_bar_x, 61)
         mp.set_text(".", 4)
         old_prog_bar_x = prog_bar_x
 
@@ -16,6 +16,7 @@ import displayio
 import digitalio
 import analogio
 import supervisor
+from micropython import const
 from simpleio import map_range
 import adafruit_pyportal
 from adafruit_display_text.label import Label
@@ -33,6 +34,7 @@ board.DISPLAY.brightness = 0
 SAMPLE_INTERVAL = 600  # Check corrosion conditions (seconds)
 QUALITY_THRESHOLD = 8  # Quality warning threshold (out of 10)
 BRIGHTNESS = 0.75  # Maximum display and neopixel brightness
+SHOP_GROUP = "shop"  # AIO group containing the workshop sensor feeds
 
 # fmt: off
 WEEKDAY = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
@@ -43,6 +45,9 @@ MONTH = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "
 message = ""
 corrosion_index = 0
 clock_tick = False
+clock_minute = None  # The minute shown on the clock display
+alert_queue = []  # Pending alert message steps: (text, color, duration)
+alert_step_end = 0  # Time when the current alert step ends
 
 # Instantiate the PyPortal
 pyportal = adafruit_pyportal.PyPortal(
@@ -58,6 +63,7 @@ led.value = False
 
 # Instantiate the light sensor
 light_sensor = analogio.AnalogIn(board.LIGHT)
+light_raw = light_sensor.value  # Light sensor moving average
 
 # Instantiate the PCB temperature sensor
 corrosion_sensor = adafruit_adt7410.ADT7410(board.I2C())
@@ -75,20 +81,20 @@ WIDTH = board.DISPLAY.width  # 320 for PyPortal
 HEIGHT = board.DISPLAY.height  # 240 for PyPortal
 
 # Default colors
-BLACK = 0x000000
-RED = 0xFF0000
-ORANGE = 0xFF8811
-YELLOW = 0xFFFF00
-GREEN = 0x00FF00
-LT_GRN = 0x00BB00
-CYAN = 0x00FFFF
-BLUE = 0x0000FF
-LT_BLUE = 0x000044
-VIOLET = 0x9900FF
-DK_VIO = 0x110022
-WHITE = 0xFFFFFF
-GRAY = 0x444455
-LCARS_LT_BLU = 0x1B6BA7
+BLACK = const(0x000000)
+RED = const(0xFF0000)
+ORANGE = const(0xFF8811)
+YELLOW = const(0xFFFF00)
+GREEN = const(0x00FF00)
+LT_GRN = const(0x00BB00)
+CYAN = const(0x00FFFF)
+BLUE = const(0x0000FF)
+LT_BLUE = const(0x000044)
+VIOLET = const(0x9900FF)
+DK_VIO = const(0x110022)
+WHITE = const(0xFFFFFF)
+GRAY = const(0x444455)
+LCARS_LT_BLU = const(0x1B6BA7)
 
 # Define the display group
 image_group = displayio.Group()
@@ -180,6 +186,15 @@ image_group.append(sd_icon_mask)
 wifi_icon_mask = Rect(4, 188, 72, 30, fill=LCARS_LT_BLU, outline=None, stroke=0)
 image_group.append(wifi_icon_mask)
 
+# Current icon mask fill colors; used to skip redundant mask updates
+mask_fill = {
+    sensor_icon_mask: LCARS_LT_BLU,
+    heater_icon_mask: LCARS_LT_BLU,
+    clock_icon_mask: LCARS_LT_BLU,
+    sd_icon_mask: LCARS_LT_BLU,
+    wifi_icon_mask: LCARS_LT_BLU,
+}
+
 # PCB Temperature
 pcb_temp = Label(FONT_1, text="°", color=CYAN)
 pcb_temp.anchor_point = (0.5, 0.5)
@@ -189,24 +204,43 @@ image_group.append(pcb_temp)
 gc.collect()
 
 
-def get_last_value(feed_key):
-    """Fetch the latest value of the AIO feed.
-    :param str feed_key: The AIO feed key."""
-    wifi_icon_mask.fill = None
+def get_group_values(group_key):
+    """Fetch the latest values of all feeds in an AIO group with a single
+    request. Returns a dictionary of last values keyed by feed key.
+    :param str group_key: The AIO group key. No default."""
+    masks_off(wifi_icon_mask)
     try:
-        # print(f"throttle limit: {pyportal.network.io_client.get_remaining_throttle_limit()}")
         while pyportal.network.io_client.get_remaining_throttle_limit() <= 10:
             time.sleep(1)  # Wait until throttle limit increases
-        last_value = pyportal.network.io_client.receive_data(feed_key)["value"]
-        wifi_icon_mask.fill = LCARS_LT_BLU
-        return last_value
+        group = pyportal.network.io_client.get_group(group_key)
+        masks_on(wifi_icon_mask)
+        return {feed["key"]: feed["last_value"] for feed in group["feeds"]}
     except Exception as e:
         # Persistent PyPortal hardware issue: 372, 376 in adafruit_esp32spi._wait_spi_char
-        print(f"Error fetching data from feed {feed_key}: {e}")
+        print(f"Error fetching data from group {group_key}: {e}")
         print("  MCU will soft reset in 30 seconds.")
         time.sleep(30)
         supervisor.reload()  # soft reset: keeps the terminal session alive
-    wifi_icon_mask.fill = LCARS_LT_BLU
+
+
+def masks_on(*masks):
+    """Cover the status icons with their masks. Masks that are already
+    on are not redrawn.
+    :param Rect masks: The icon masks to turn on. No default."""
+    for mask in masks:
+        if mask_fill[mask] != LCARS_LT_BLU:
+            mask.fill = LCARS_LT_BLU
+            mask_fill[mask] = LCARS_LT_BLU
+
+
+def masks_off(*masks):
+    """Reveal the status icons under their masks. Masks that are already
+    off are not redrawn.
+    :param Rect masks: The icon masks to turn off. No default."""
+    for mask in masks:
+        if mask_fill[mask] is not None:
+            mask.fill = None
+            mask_fill[mask] = None
 
 
 def toggle_clock_tick():
@@ -221,98 +255,110 @@ def toggle_clock_tick():
     return
 
 
-def update_display():
-    """Fetch last values and update the display."""
+def format_clock(local_time):
+    """Create the 12-hour clock display string.
+    :param struct_time local_time: The current local time. No default."""
+    hour = (local_time.tm_hour - 1) % 12 + 1  # 12-hour clock
+    return f"{hour:2d}:{local_time.tm_min:02d}"
+
+
+def update_display(values):
+    """Update the display with the latest time and feed values.
+    :param dict values: The last feed values from get_group_values(). No default."""
     # Get the local time and provide hour-of-day for is_daytime method
-    clock_icon_mask.fill = None
-    wifi_icon_mask.fill = None
+    masks_off(clock_icon_mask, wifi_icon_mask)
     try:
         pyportal.network.get_local_time(os.getenv("TIMEZONE"))
     except Exception as e:
         print(f"Error fetching local time: {e}")
 
-    wifi_icon_mask.fill = LCARS_LT_BLU
+    masks_on(wifi_icon_mask)
 
-    if time.localtime().tm_hour > 12:
-        hour = time.localtime().tm_hour - 12
-    else:
-        hour = time.localtime().tm_hour
-    if hour == 0:
-        hour = 12
-
-    display_time = f"{hour:2d}:{time.localtime().tm_min:02d}"
-    clock_digits.text = display_time
+    local_time = time.localtime()
+    display_time = format_clock(local_time)
+    if display_time != clock_digits.text:
+        clock_digits.text = display_time
     print(f"Local Time: {display_time}")
 
-    wday = time.localtime().tm_wday
-    month = time.localtime().tm_mon
-    day = time.localtime().tm_mday
-    year = time.localtime().tm_year
-    clock_day_mon_yr.text = f"{WEEKDAY[wday]}  {MONTH[month - 1]} {day:02d}, {year:04d}"
+    wday = local_time.tm_wday
+    month = local_time.tm_mon
+    day = local_time.tm_mday
+    year = local_time.tm_year
+    display_date = f"{WEEKDAY[wday]}  {MONTH[month - 1]} {day:02d}, {year:04d}"
+    if display_date != clock_day_mon_yr.text:
+        clock_day_mon_yr.text = display_date
 
-    clock_icon_mask.fill = LCARS_LT_BLU
+    masks_on(clock_icon_mask)
 
     # Get the workshop sensor data and update the display
-    sensor_icon_mask.fill = None
+    masks_off(sensor_icon_mask)
 
-    pcb_temp.text = f"{read_pcb_temperature():.1f}°"
-    temperature.text = f"{float(get_last_value("shop.int-temperature")):.1f}°"
-    humidity.text = f"{float(get_last_value("shop.int-humidity")):.0f}%"
-    dew_point.text = f"{float(get_last_value("shop.int-dewpoint")):.1f}° Dew"
+    pcb_temperature = f"{read_pcb_temperature():.1f}°"
+    if pcb_temperature != pcb_temp.text:
+        pcb_temp.text = pcb_temperature
+    temperature.text = f"{float(values['shop.int-temperature']):.1f}°"
+    humidity.text = f"{float(values['shop.int-humidity']):.0f}%"
+    dew_point.text = f"{float(values['shop.int-dewpoint']):.1f}° Dew"
 
     # Display the corrosion status. Default is no corrosion potential (0 = GREEN).
-    corrosion_index = float(get_last_value("shop.int-corrosion-index"))
+    corrosion_index = float(values["shop.int-corrosion-index"])
     if corrosion_index == 0:
         status_icon.fill = LT_GRN
         status.color = None
         alert("NORMAL")
-        heater_icon_mask.fill = LCARS_LT_BLU
-        sensor_icon_mask.fill = LCARS_LT_BLU
+        masks_on(heater_icon_mask, sensor_icon_mask)
     elif corrosion_index == 1:
         status_icon.fill = YELLOW
         status.color = RED
         alert("CORROSION WARNING")
-        heater_icon_mask.fill = LCARS_LT_BLU
-        sensor_icon_mask.fill = LCARS_LT_BLU
+        masks_on(heater_icon_mask, sensor_icon_mask)
     elif corrosion_index == 2:
         status_icon.fill = RED
         status.color = BLACK
         alert("CORROSION ALERT")
-        heater_icon_mask.fill = None
-        sensor_icon_mask.fill = None
+        masks_off(heater_icon_mask, sensor_icon_mask)
 
-    wifi_icon_mask.fill = LCARS_LT_BLU
+    masks_on(wifi_icon_mask)
 
 
 def alert(text=""):
-    # Place alert message in clock message area. Default is the previous message.
+    # Place alert message in clock message area. Default clears the message.
+    # The blink sequence is queued and played by update_alert() without blocking.
     msg_text = text[:20]
     if msg_text == "" or msg_text is None:
-        msg_text = ""
-        display_message.text = msg_text
+        alert_queue.clear()
+        display_message.text = ""
     else:
         print("ALERT: " + msg_text)
-        display_message.color = RED
-        display_message.text = msg_text
-        time.sleep(0.1)
-        display_message.color = YELLOW
-        time.sleep(0.1)
-        display_message.color = RED
-        time.sleep(0.1)
-        display_message.color = YELLOW
-        time.sleep(0.5)
-        display_message.color = None
+        alert_queue.append((msg_text, RED, 0.1))
+        alert_queue.append((msg_text, YELLOW, 0.1))
+        alert_queue.append((msg_text, RED, 0.1))
+        alert_queue.append((msg_text, YELLOW, 0.5))
+        alert_queue.append((msg_text, None, 0))
+        update_alert()
     return
 
 
+def update_alert():
+    """Advance the queued alert message blink sequence when the current
+    step's duration has elapsed."""
+    global alert_step_end
+    if alert_queue and time.monotonic() >= alert_step_end:
+        msg_text, color, duration = alert_queue.pop(0)
+        if msg_text != display_message.text:
+            display_message.text = msg_text
+        display_message.color = color
+        alert_step_end = time.monotonic() + duration
+
+
 def adjust_brightness():
     """Acquire the current lux light sensor value and gradually adjust
     display brightness. Full-scale raw light sensor value (65535)
-    is approximately 1100 Lux."""
-    raw = 0
-    for i in range(2000):
-        raw = raw + light_sensor.value
-    target_bright = round(map_range(raw / 2000 / 65535 * 1100, 11, 20, 0.01, BRIGHTNESS), 3)
+    is approximately 1100 Lux. The raw value is smoothed with an
+    exponential moving average of one sensor reading per call."""
+    global light_raw
+    light_raw = light_raw + ((light_sensor.value - light_raw) * 0.02)
+    target_bright = round(map_range(light_raw / 65535 * 1100, 11, 20, 0.01, BRIGHTNESS), 3)
     new_bright = board.DISPLAY.brightness + ((target_bright - board.DISPLAY.brightness) / 5)
     pyportal.set_backlight(round(new_bright, 3))
 
@@ -324,12 +370,13 @@ def read_pcb_temperature():
 
 last_weather_update = time.monotonic()
 
-# Set Initial Quality Value
+# Set Initial Quality Value; the system-watchdog feed must also be added
+#   to the shop group so that it's fetched with the sensor feeds
 quality = 10
-watchdog = get_last_value("system-watchdog")
-previous_watchdog = watchdog
+feed_values = get_group_values(SHOP_GROUP)  # Fetch initial data from AIO
+previous_watchdog = feed_values["system-watchdog"]
 
-update_display()  # Fetch initial data from AIO
+update_display(feed_values)
 
 
 ### Main Loop ###
@@ -339,8 +386,10 @@ while True:
     # Update weather every SAMPLE_INTERVAL seconds
     if current_time - last_weather_update > SAMPLE_INTERVAL:
 
+        feed_values = get_group_values(SHOP_GROUP)
+
         # Test for feed quality
-        watchdog = get_last_value("system-watchdog")
+        watchdog = feed_values["system-watchdog"]
         if watchdog == previous_watchdog:
             quality -= 1
             if quality < 0: quality = 0
@@ -359,21 +408,21 @@ while True:
 
         last_weather_update = current_time
 
-        update_display()
+        update_display(feed_values)
 
     # Update time every second
     toggle_clock_tick()
-    if time.localtime().tm_hour > 12:
-        hour = time.localtime().tm_hour - 12
-    else:
-        hour = time.localtime().tm_hour
-    if hour == 0:
-        hour = 12
-
-    display_time = f"{hour:2d}:{time.localtime().tm_min:02d}"
-    clock_digits.text = display_time
+    local_time = time.localtime()
+    if local_time.tm_min != clock_minute:
+        clock_minute = local_time.tm_min
+        display_time = format_clock(local_time)
+        if display_time != clock_digits.text:
+            clock_digits.text = display_time  # Only redraw the clock font when changed
 
     adjust_brightness()
-    time.sleep(
-        max(min(1.0 - (time.monotonic() - current_time), 1.0), 0)
-    )  # Adjust for processing time
+
+    # Play alert blinks while waiting for the next clock tick
+    update_alert()
+    while time.monotonic() - current_time < 1.0:
+        time.sleep(0.05)
+        update_alert()
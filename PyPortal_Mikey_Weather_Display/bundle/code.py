@@ -29,7 +29,13 @@ board.DISPLAY.brightness = 0
 # AIO Weather Receiver Parameters
 SAMPLE_INTERVAL = 1200  # Check conditions (seconds)
 BRIGHTNESS = 0.75
+BRIGHTNESS_INTERVAL = 5  # Adjust brightness every 5 clock ticks (seconds)
 SOUND = True
+WEATHER_GROUP = "default"  # AIO group containing the weather feeds
+THROTTLE_RESERVE = 10  # AIO requests to leave for other devices on the account
+THROTTLE_MARGIN = 2  # Estimated requests above the reserve that prompt a query
+THROTTLE_MAX_AGE = 60  # Seconds before the throttle estimate is refreshed
+THROTTLE_BACKOFF_MAX = 30  # Throttle query backoff limit (seconds)
 
 # fmt: off
 WEEKDAY = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
@@ -39,6 +45,12 @@ MONTH = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "
 # Start-up values
 message = ""
 clock_tick = False
+brightness_tick = 0  # Clock ticks since start-up, for brightness adjustment
+last_icon_file = "/icons/01d.bmp"  # The currently displayed icon file
+alert_queue = []  # Pending alert message steps: (text, color, duration)
+alert_step_end = 0  # Time when the current alert step ends
+throttle_remaining = None  # Estimated AIO requests remaining before throttling
+throttle_checked = 0  # Time of the last AIO throttle limit query
 
 # Instantiate the PyPortal
 pyportal = adafruit_pyportal.PyPortal(
@@ -57,12 +69,21 @@ led.value = False
 
 # Instantiate the light sensor
 light_sensor = analogio.AnalogIn(board.LIGHT)
+light_raw = light_sensor.value  # Light sensor moving average
 
 # Load the text fonts from the fonts folder
 SMALL_FONT = bitmap_font.load_font("/fonts/Arial-12.bdf")
 MEDIUM_FONT = bitmap_font.load_font("/fonts/Arial-16.bdf")
 LARGE_FONT = bitmap_font.load_font("/fonts/Arial-Bold-24.bdf")
 
+# Preload only the glyphs each font displays, at startup rather than when first used
+#   Small: descriptions, sunrise/sunset, gusts, humidity, and alert messages
+#   Medium: date, clock, and wind direction/speed
+#   Large: condition code and temperature
+SMALL_FONT.load_glyphs("0123456789:.,°%-/ ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+MEDIUM_FONT.load_glyphs("0123456789:,- AMPHNESW" + "".join(WEEKDAY) + "".join(MONTH))
+LARGE_FONT.load_glyphs("0123456789-°" + "".join(kit_to_icon))
+
 # The board's integral display size
 WIDTH = board.DISPLAY.width  # 320 for PyPortal
 HEIGHT = board.DISPLAY.height  # 240 for PyPortal
@@ -81,7 +102,7 @@ image_group = displayio.Group()
 board.DISPLAY.root_group = image_group  # Load display and watch it build
 
 ### Define display graphic, label, and value areas
-# Create an icon background layer; image_group[0]
+# Create an icon background layer; image_group[0]. Icon bitmaps are swapped in place.
 icon_image = displayio.OnDiskBitmap("/icons/01d.bmp")
 icon_bg = displayio.TileGrid(icon_image, pixel_shader=icon_image.pixel_shader, x=WIDTH//2-80, y=HEIGHT//2-80)
 image_group.append(icon_bg)
@@ -155,6 +176,10 @@ display_message.anchor_point = (0.5, 0.5)
 display_message.anchored_position = (board.DISPLAY.width // 2, 231)
 image_group.append(display_message)
 
+# 12-hour clock hour and AM/PM suffix lookup table, indexed by 24-hour clock hour
+AM_PM = tuple(((hour - 1) % 12 + 1, "AM" if hour < 12 else "PM") for hour in range(24))
+
+# Start with a clean heap; the explicit collections below supplement automatic collection
 gc.collect()
 
 
@@ -162,30 +187,47 @@ def am_pm(hour):
     """Provide an adjusted hour and AM/PM string to create to a
     12-hour time string.
     :param int hour: The clock hour. No default."""
-    if hour < 12:
-        if hour == 0:
-            hour = 12
-        return hour, "AM"
-    if hour == 12:
-        return 12, "PM"
-    if hour > 12:
-        hour = hour - 12
-    return hour, "PM"
-
-
-def get_last_value(feed_key):
-    """Fetch the latest value of the AIO feed.
-    :param str feed_key: The AIO feed key."""
+    return AM_PM[hour]
+
+
+def format_clock(local_time):
+    """Create the 12-hour clock display string with AM/PM suffix.
+    :param struct_time local_time: The current local time. No default."""
+    hour, suffix = am_pm(local_time.tm_hour)
+    return f"{hour:2d}:{local_time.tm_min:02d} {suffix}"
+
+
+def throttle_wait():
+    """Check the AIO throttle estimate before the weather group fetch. With a
+    20 minute sample interval the estimate is usually stale, so this is
+    normally one query; the clock keeps ticking if a backoff is needed."""
+    global throttle_remaining, throttle_checked
+    if (
+        throttle_remaining is None
+        or throttle_remaining <= THROTTLE_RESERVE + THROTTLE_MARGIN
+        or time.monotonic() - throttle_checked > THROTTLE_MAX_AGE
+    ):
+        retry = 1
+        throttle_remaining = pyportal.network.io_client.get_remaining_throttle_limit()
+        while throttle_remaining <= THROTTLE_RESERVE:
+            busy(min(2**retry, THROTTLE_BACKOFF_MAX))
+            retry += 1
+            throttle_remaining = pyportal.network.io_client.get_remaining_throttle_limit()
+        throttle_checked = time.monotonic()
+    throttle_remaining -= 1
+
+
+def get_group_values(group_key):
+    """Fetch the latest values of all feeds in an AIO group with a single
+    request. Returns a dictionary of last values keyed by feed key.
+    :param str group_key: The AIO group key. No default."""
     try:
-        # print(f"throttle limit: {pyportal.network.io_client.get_remaining_throttle_limit()}")
-        while pyportal.network.io_client.get_remaining_throttle_limit() <= 10:
-            time.sleep(1)  # Wait until throttle limit increases
-        # time.sleep(1)  # Wait after throttle check query to retrieve feed
-        last_value = pyportal.network.io_client.receive_data(feed_key)["value"]
-        return last_value
+        throttle_wait()
+        group = pyportal.network.io_client.get_group(group_key)
+        return {feed["key"]: feed["last_value"] for feed in group["feeds"]}
     except Exception as e:
         # 372, 376 in adafruit_esp32spi._wait_spi_char
-        print(f"Error fetching data from feed {feed_key}: {e}")
+        print(f"Error fetching data from group {group_key}: {e}")
         print("  MCU will soft reset in 30 seconds.")
         time.sleep(30)
         supervisor.reload()  # soft reset: keeps the terminal session alive
@@ -203,10 +245,35 @@ def toggle_clock_tick():
     return
 
 
+def busy(delay):
+    """An alternative 'time.sleep' function that toggles the clock tick and
+    updates the clock display once per second. A blocking method.
+    :param float delay: The time delay in seconds. No default."""
+    global brightness_tick
+    for blinks in range(int(round(delay, 0))):
+        start = time.monotonic()
+        toggle_clock_tick()
+        display_time = format_clock(time.localtime())
+        if display_time != clock_digits.text:
+            clock_digits.text = display_time
+            gc.collect()  # Scheduled collection once per minute
+
+        # Watch for and adjust to ambient light changes
+        brightness_tick += 1
+        if brightness_tick % BRIGHTNESS_INTERVAL == 0:
+            adjust_brightness()
+
+        # Play alert blinks while waiting for the next clock tick
+        update_alert()
+        while time.monotonic() - start < 1.0:
+            time.sleep(0.05)
+            update_alert()
+
+
 def update_display():
     """Fetch last values and update the display."""
+    global last_icon_file
     alert("UPDATE CONDITIONS")
-    gc.collect()
 
     # Get the local time and provide hour-of-day for is_daytime method
     try:
@@ -214,78 +281,98 @@ def update_display():
     except Exception as e:
         print(f"Error fetching local time: {e}")
 
-    hour, suffix = am_pm(time.localtime().tm_hour)
-    display_time = f"{hour:2d}:{time.localtime().tm_min:02d} {suffix}"
-    clock_digits.text = display_time
+    local_time = time.localtime()
+    display_time = format_clock(local_time)
+    if display_time != clock_digits.text:
+        clock_digits.text = display_time
     print(f"Local Time: {display_time}")
 
-    wday = time.localtime().tm_wday
-    month = time.localtime().tm_mon
-    day = time.localtime().tm_mday
-    year = time.localtime().tm_year
+    wday = local_time.tm_wday
+    month = local_time.tm_mon
+    day = local_time.tm_mday
+    year = local_time.tm_year
     clock_day_mon_yr.text = f"{WEEKDAY[wday]}  {MONTH[month - 1]} {day:02d}, {year:04d}"
 
-    # Get weather conditions from client AIO feeds
-    wind_dir = get_last_value("weather-winddirection")
-    windspeed.text = f"{wind_dir} {float(get_last_value("weather-windspeed")):.0f} MPH"
-    windgust.text = f"{float(get_last_value("weather-windgusts")):.0f} MPH Gusts"
+    # Get weather conditions from client AIO feeds with a single group request
+    values = get_group_values(WEATHER_GROUP)
+    gc.collect()  # Release the group response
+    wind_dir = values["weather-winddirection"]
+    windspeed.text = f"{wind_dir} {float(values['weather-windspeed']):.0f} MPH"
+    windgust.text = f"{float(values['weather-windgusts']):.0f} MPH Gusts"
 
     # get sunrise and sunset and daylight here
 
-    daylight = get_last_value("weather-daylight")
+    daylight = values["weather-daylight"]
 
-    description.text = get_last_value("weather-description")
-    long_desc.text = kit_to_icon[description.text][0]
+    condition = values["weather-description"]
+    condition_entry = kit_to_icon[condition]
+    description.text = condition
+    long_desc.text = condition_entry[0]
 
     # Create icon filename
     if daylight == "True":
         icon_suffix = "d"
     else:
         icon_suffix = "n"
-    icon_file = f"/icons/{kit_to_icon[description.text][1]}{icon_suffix}.bmp"
+    icon_file = f"/icons/{condition_entry[1]}{icon_suffix}.bmp"
     print(f"Icon filename: {icon_file}")
 
-    image_group.pop(0)
-    icon_image = displayio.OnDiskBitmap(icon_file)
-    icon_bg = displayio.TileGrid(icon_image, pixel_shader=icon_image.pixel_shader, x=WIDTH//2-80, y=HEIGHT//2-80)
-    image_group.insert(0, icon_bg)
+    # Replace the icon only when it has changed
+    if icon_file != last_icon_file:
+        icon_image = displayio.OnDiskBitmap(icon_file)
+        icon_bg.bitmap = icon_image  # Reuse the icon TileGrid
+        icon_bg.pixel_shader = icon_image.pixel_shader
+        last_icon_file = icon_file
+        gc.collect()  # Release the previous icon
 
-    temperature.text = f"{float(get_last_value("weather-temperature")):.0f}°"
-    humidity.text = f"{float(get_last_value("weather-humidity")):.0f}% RH"
+    temperature.text = f"{float(values['weather-temperature']):.0f}°"
+    humidity.text = f"{float(values['weather-humidity']):.0f}% RH"
 
-    gc.collect()
     alert("  READY")
 
 
 def alert(text=""):
-    # Place alert message in clock message area. Default is the previous message.
+    # Place alert message in clock message area. Default clears the message.
+    # The blink sequence is queued and played by update_alert() without blocking.
     msg_text = text[:20]
     if msg_text == "" or msg_text is None:
-        msg_text = ""
-        display_message.text = msg_text
+        alert_queue.clear()
+        display_message.text = ""
     else:
         print("ALERT: " + msg_text)
-        display_message.color = RED
-        display_message.text = msg_text
-        time.sleep(0.1)
-        display_message.color = YELLOW
-        time.sleep(0.1)
-        display_message.color = RED
-        time.sleep(0.1)
-        display_message.color = YELLOW
-        time.sleep(0.5)
-        display_message.color = None
+        alert_queue.append((msg_text, RED, 0.1))
+        alert_queue.append((msg_text, YELLOW, 0.1))
+        alert_queue.append((msg_text, RED, 0.1))
+        alert_queue.append((msg_text, YELLOW, 0.5))
+        alert_queue.append((msg_text, None, 0))
+        update_alert()
     return
 
 
+def update_alert():
+    """Advance the queued alert message blink sequence when the current
+    step's duration has elapsed."""
+    global alert_step_end
+    if alert_queue and time.monotonic() >= alert_step_end:
+        msg_text, color, duration = alert_queue.pop(0)
+        if msg_text != display_message.text:
+            display_message.text = msg_text
+        display_message.color = color
+        alert_step_end = time.monotonic() + duration
+
+
 def adjust_brightness():
     """Acquire the current lux light sensor value and gradually adjust
     display brightness. Full-scale raw light sensor value (65535)
-    is approximately 1100 Lux."""
+    is approximately 1100 Lux. A short burst of sensor readings is smoothed
+    with an exponential moving average."""
+    global light_raw
+    sensor = light_sensor
     raw = 0
-    for i in range(2000):
-        raw = raw + light_sensor.value
-    target_bright = round(map_range(raw / 2000 / 65535 * 1100, 11, 20, 0.01, BRIGHTNESS), 3)
+    for i in range(16):
+        raw = raw + sensor.value
+    light_raw = (0.8 * light_raw) + (0.2 * raw / 16)
+    target_bright = round(map_range(light_raw / 65535 * 1100, 11, 20, 0.01, BRIGHTNESS), 3)
     new_bright = board.DISPLAY.brightness + ((target_bright - board.DISPLAY.brightness) / 5)
     pyportal.set_backlight(round(new_bright, 3))
 
@@ -303,12 +390,4 @@ while True:
         last_weather_update = current_time
 
     # Update time every second
-    toggle_clock_tick()
-    hour, suffix = am_pm(time.localtime().tm_hour)
-    display_time = f"{hour:2d}:{time.localtime().tm_min:02d} {suffix}"
-    clock_digits.text = display_time
-
-    adjust_brightness()
-    time.sleep(
-        max(min(1.0 - (time.monotonic() - current_time), 1.0), 0)
-    )  # Adjust for processing time
+    busy(1)
@@ -24,7 +24,6 @@ import supervisor
 import neopixel
 from simpleio import map_range
 
-from adafruit_datetime import datetime
 import adafruit_connection_manager
 import wifi
 import adafruit_requests
@@ -36,19 +35,19 @@ from cedargrove_temperaturetools.unit_converters import (
 )
 from cedargrove_temperaturetools.dew_point import dew_point as dew_point_calc
 from cedargrove_dst_adjuster import _detect_dst as is_dst
-from source_display_graphics import Display
+from source_display_graphics import Display, WEEKDAY, MONTH
 
 # TFT Display Parameters
 BRIGHTNESS = 1.0
 ROTATION = 180
 LIGHT_SENSOR = True  # True when ALS-PT19 sensor is connected to board.A3
+BRIGHTNESS_INTERVAL = 5  # Adjust brightness every 5 clock ticks (seconds)
 
 display = Display(rotation=ROTATION, brightness=BRIGHTNESS)
 
 # fmt: off
-# A couple of day/month lookup tables
-WEEKDAY = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-MONTH = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec", ]
+# A compass lookup table
+COMPASS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
 
 # Define a few state and mode colors
 STARTUP = display.VIOLET
@@ -61,8 +60,32 @@ THROTTLE_DELAY = display.LT_GRN
 # Operating Mode
 display.mode.text = "DISPLAY"
 
+# Exterior data status masks; blanked together while the fields are updated
+DATA_MASKS = (
+    display.temp_mask,
+    display.humid_mask,
+    display.dew_pt_mask,
+    display.wind_mask,
+    display.gusts_mask,
+)
+
 # Display Mode Parameters
 SAMPLE_INTERVAL = 240  # Check sensor and AIO Weather (seconds)
+KMH_TO_MPH = 0.6214  # AIO+ Weather wind speed conversion factor
+SHOP_GROUP = "shop"  # AIO group containing the workshop sensor feeds
+THROTTLE_RESERVE = 10  # AIO requests held in reserve; wait when at or below
+THROTTLE_MARGIN = 2  # Re-query the limit when the estimate nears the reserve
+THROTTLE_MAX_AGE = 60  # Re-query the limit after this many seconds
+THROTTLE_BACKOFF_MAX = 30  # Longest wait between throttle queries (seconds)
+DEBUG = False  # True to print status and conditions to the serial console
+
+# Local time zone name and standard time offset from UTC (hours)
+TIMEZONE = os.getenv("TIMEZONE")
+STD_TIMEZONE_OFFSET = os.getenv("TIMEZONE_OFFSET")
+
+# AIO+ Weather topic key and description
+WEATHER_TOPIC_KEY = os.getenv("WEATHER_TOPIC_KEY")
+WEATHER_TOPIC_DESC = os.getenv("WEATHER_TOPIC_DESC")
 
 # Internal cooling fan threshold
 FAN_ON_THRESHOLD_F = 100  # Degrees Fahrenheit
@@ -86,22 +109,72 @@ pixel[0] = STARTUP  # Initializing
 
 # Initialize Heartbeat Indicator Value and brightness history
 clock_tick = False
+brightness_tick = 0  # Clock ticks since start-up, for brightness adjustment
 old_brightness = BRIGHTNESS
+light_raw = None  # Light sensor 8-bit moving average
+
+# Initialize the local AIO throttle limit estimate
+throttle_remaining = None  # Estimated requests remaining before throttling
+throttle_checked = 0  # Time of the last throttle limit query
+
+# Nesting depth of AIO fetches; the fetch indicators change only at the outermost level
+fetch_depth = 0
+
+# 12-hour clock hour and AM/PM suffix lookup table, indexed by 24-hour clock hour
+AM_PM = tuple(((hour - 1) % 12 + 1, "AM" if hour < 12 else "PM") for hour in range(24))
+
+# The currently displayed date: (year, month, day)
+clock_date = None
+
+
+def debug_print(*args):
+    """Print to the serial console only when DEBUG is True. Errors and
+    warnings are always printed with print().
+    :param args: The values to print. No default."""
+    if DEBUG:
+        print(*args)
 
 
 def am_pm(hour):
     """Provide an adjusted hour and AM/PM string to create to a
     12-hour time string.
     :param int hour: The clock hour. No default."""
-    if hour < 12:
-        if hour == 0:
-            hour = 12
-        return hour, "AM"
-    if hour == 12:
-        return 12, "PM"
-    if hour > 12:
-        hour = hour - 12
-    return hour, "PM"
+    return AM_PM[hour]
+
+
+def format_clock(local_time):
+    """Create the 12-hour clock display string.
+    :param struct_time local_time: The current local time. No default."""
+    hour, _ = am_pm(local_time.tm_hour)
+    return f"{hour:2d}:{local_time.tm_min:02d}"
+
+
+def iso_timestamp(iso_time):
+    """Convert an ISO 8601 time string ("YYYY-MM-DDTHH:MM:SS...") to seconds
+    since the epoch without the time zone adjustment.
+    :param str iso_time: The ISO 8601 time string. No default."""
+    return time.mktime(
+        (
+            int(iso_time[0:4]),
+            int(iso_time[5:7]),
+            int(iso_time[8:10]),
+            int(iso_time[11:13]),
+            int(iso_time[14:16]),
+            int(iso_time[17:19]),
+            0,
+            -1,
+            -1,
+        )
+    )
+
+
+def set_text(label, text):
+    """Update a label's text only when it has changed to avoid needlessly
+    rebuilding the label's glyphs.
+    :param Label label: The display label. No default.
+    :param str text: The new label text. No default."""
+    if label.text != text:
+        label.text = text
 
 
 def read_cpu_temp():
@@ -125,66 +198,147 @@ def wind_direction(heading):
     :param int heading: The compass heading. No default."""
     if heading is None:
         return "--"
-    return ["N", "NE", "E", "SE", "S", "SW", "W", "NW"][
-        int(((heading + 22.5) % 360) / 45)
-    ]
+    return COMPASS[((int(heading) + 22) // 45) & 7]  # Integer-only sector index
+
+
+def begin_fetch():
+    """Show the NeoPixel and Wi-Fi icon fetch indicators when the outermost
+    of a set of nested AIO fetches begins."""
+    global fetch_depth
+    if fetch_depth == 0:
+        pixel[0] = FETCH
+        display.wifi_icon_mask.fill = None
+    fetch_depth += 1
+
+
+def end_fetch():
+    """Restore the NeoPixel and Wi-Fi icon indicators when the outermost of a
+    set of nested AIO fetches ends."""
+    global fetch_depth
+    fetch_depth -= 1
+    if fetch_depth == 0:
+        display.wifi_icon_mask.fill = display.LCARS_LT_BLU
+        pixel[0] = NORMAL  # Success
+
+
+def throttle_wait():
+    """Hold off the next feed or weather fetch while the AIO throttle limit is
+    at THROTTLE_RESERVE. The clock and alerts keep running during the wait."""
+    global throttle_remaining, throttle_checked
+    if (
+        throttle_remaining is None
+        or throttle_remaining <= THROTTLE_RESERVE + THROTTLE_MARGIN
+        or time.monotonic() - throttle_checked > THROTTLE_MAX_AGE
+    ):
+        retry = 1
+        throttle_remaining = io.get_remaining_throttle_limit()
+        while throttle_remaining <= THROTTLE_RESERVE:
+            pixel[0] = THROTTLE_DELAY
+            busy(min(2**retry, THROTTLE_BACKOFF_MAX))  # Clock display keeps updating
+            retry += 1
+            throttle_remaining = io.get_remaining_throttle_limit()
+        throttle_checked = time.monotonic()
+    throttle_remaining -= 1
 
 
 def get_last_value(feed_key, json=False):
-    """Fetch the latest value of the AIO feed.
+    """Fetch the latest value of the AIO feed. The requests session keeps its
+    socket open between fetches; a failed fetch closes the pooled sockets and
+    is retried once on a fresh connection before resetting.
     :param str feed_key: The AIO feed key.
     :param bool json: Return json string rather than feed["value"]."""
-    pixel[0] = FETCH
-    display.wifi_icon_mask.fill = None
-    try:
-        # print(f"throttle limit: {io.get_remaining_throttle_limit()}")
-        while io.get_remaining_throttle_limit() <= 10:
-            pixel[0] = THROTTLE_DELAY
-            time.sleep(1)  # Wait until throttle limit increases
-        pixel[0] = FETCH
-        if json:
-            last_value = io.receive_data(feed_key)
-        else:
-            last_value = io.receive_data(feed_key)["value"]
-    except Exception as aio_feed_error:
-        soft_reset(error=aio_feed_error, desc="AIO feed")
-    display.wifi_icon_mask.fill = display.LCARS_LT_BLU
-    pixel[0] = NORMAL  # Success
+    begin_fetch()
+    for attempt in range(2):
+        try:
+            throttle_wait()
+            pixel[0] = FETCH
+            if json:
+                last_value = io.receive_data(feed_key)
+            else:
+                last_value = io.receive_data(feed_key)["value"]
+            break
+        except Exception as aio_feed_error:
+            if attempt:
+                soft_reset(error=aio_feed_error, desc="AIO feed")
+            print(f"AIO feed: {str(aio_feed_error)}")
+            print("  Reconnecting and retrying ...")
+            adafruit_connection_manager.connection_manager_close_all(pool)
+    end_fetch()
     return last_value
 
 
-def busy(delay):
+def get_group_values(group_key):
+    """Fetch the latest values of all feeds in an AIO group with a single
+    request. Returns a dictionary of last values keyed by feed key. A failed
+    fetch is retried once on a fresh connection before resetting.
+    :param str group_key: The AIO group key. No default."""
+    begin_fetch()
+    for attempt in range(2):
+        try:
+            throttle_wait()
+            pixel[0] = FETCH
+            group = io.get_group(group_key)
+            break
+        except Exception as aio_group_error:
+            if attempt:
+                soft_reset(error=aio_group_error, desc="AIO group")
+            print(f"AIO group: {str(aio_group_error)}")
+            print("  Reconnecting and retrying ...")
+            adafruit_connection_manager.connection_manager_close_all(pool)
+    end_fetch()
+    return {feed["key"]: feed["last_value"] for feed in group["feeds"]}
+
+
+def busy(delay, minimal=False):
     """An alternative 'time.sleep' function that blinks the LED once per second.
     Time display is updated from localtime each second. A blocking method.
-    :param float delay: The time delay in seconds. No default."""
-    global clock_tick
+    :param float delay: The time delay in seconds. No default.
+    :param bool minimal: Only blink the LED; skip the display and sensor
+    updates. Used while waiting to reset after an error. Defaults to False."""
+    global clock_tick, brightness_tick
+    if minimal:
+        for blinks in range(int(round(delay, 0))):
+            led.value = not led.value
+            time.sleep(1)
+        return
+    # The palette does not change while busy; bind the display objects and color locally
+    clock_tick_mask = display.clock_tick_mask
+    clock_digits = display.clock_digits
+    pcb_temp = display.pcb_temp
+    tick_color = display.YELLOW
+    clock_minute = None
     for blinks in range(int(round(delay, 0))):
-        start = time.monotonic()
+        start_ns = time.monotonic_ns()
         if clock_tick:
-            display.clock_tick_mask.fill = display.YELLOW
+            clock_tick_mask.fill = tick_color
             led.value = True
         else:
-            display.clock_tick_mask.fill = None
+            clock_tick_mask.fill = None
             led.value = False
         clock_tick = not clock_tick
 
-        if time.localtime().tm_hour > 12:
-            hour = time.localtime().tm_hour - 12
-        else:
-            hour = time.localtime().tm_hour
-        if hour == 0:
-            hour = 12
+        # Rebuild the clock display only when the minute changes
+        local_time = time.localtime()
+        if local_time.tm_min != clock_minute:
+            set_text(clock_digits, format_clock(local_time))
+            clock_minute = local_time.tm_min
 
-        local_time = f"{hour:2d}:{time.localtime().tm_min:02d}"
-        display.clock_digits.text = local_time
-
-        display.pcb_temp.text = f"{gc.mem_free() / 10 ** 6:.3f} Mb  {read_cpu_temp():.0f}°  {SAMPLE_INTERVAL - blinks}"
+        # Update free memory and CPU temperature (and fan) every 10 seconds
+        if blinks % 10 == 0:
+            free_kb = gc.mem_free() // 1000
+            pcb_temp.text = f"{free_kb // 1000}.{free_kb % 1000:03d} Mb  {read_cpu_temp():.0f}°  {SAMPLE_INTERVAL - blinks}"
 
         # Watch for and adjust to ambient light changes
-        adjust_brightness()
+        brightness_tick += 1
+        if brightness_tick % BRIGHTNESS_INTERVAL == 0:
+            adjust_brightness()
+
+        # Play queued alert blinks while waiting for the next clock tick
+        while display.update_alert() and time.monotonic_ns() - start_ns < 950000000:
+            time.sleep(0.05)
 
-        delay = max((1 - (time.monotonic() - start)), 0)
-        time.sleep(delay)
+        delay_ns = 1000000000 - (time.monotonic_ns() - start_ns)
+        time.sleep(max(delay_ns, 0) / 1e9)
 
 
 def soft_reset(error, desc="", delay=30):
@@ -198,60 +352,67 @@ def soft_reset(error, desc="", delay=30):
     display.image_group = None  # Show the REPL
     print(f"  FAIL: {desc} Error: {str(error)}")
     print(f"    MCU will soft reset in {delay} seconds.")
-    busy(delay)
+    busy(delay, minimal=True)
     supervisor.reload()  # soft reset: keeps the terminal session alive
 
 
 def update_local_time():
-    global TIMEZONE_OFFSET
-    pixel[0] = FETCH  # Busy
+    global TIMEZONE_OFFSET, TIMEZONE_OFFSET_SEC, clock_date
+    begin_fetch()
     display.clock_icon_mask.fill = None
-    display.wifi_icon_mask.fill = None
     try:
-        rtc.RTC().datetime = time.struct_time(io.receive_time(os.getenv("TIMEZONE")))
+        rtc.RTC().datetime = time.struct_time(io.receive_time(TIMEZONE))
     except Exception as time_error:
         soft_reset(error=time_error, desc="Time")
 
+    local_time = time.localtime()
+
     # DST adjustment
-    if is_dst(time.localtime()):
-        TIMEZONE_OFFSET = os.getenv("TIMEZONE_OFFSET") + 1
+    if is_dst(local_time):
+        TIMEZONE_OFFSET = STD_TIMEZONE_OFFSET + 1
     else:
-        TIMEZONE_OFFSET = os.getenv("TIMEZONE_OFFSET")
-
-    hour, _ = am_pm(time.localtime().tm_hour)
-    local_time = f"{hour:2d}:{time.localtime().tm_min:02d}"
-    display.clock_digits.text = local_time
-
-    wday = time.localtime().tm_wday
-    month = time.localtime().tm_mon
-    day = time.localtime().tm_mday
-    year = time.localtime().tm_year
-    display.clock_day_mon_yr.text = (
-        f"{WEEKDAY[wday]}  {MONTH[month - 1]} {day:02d}, {year:04d}"
-    )
+        TIMEZONE_OFFSET = STD_TIMEZONE_OFFSET
+    TIMEZONE_OFFSET_SEC = TIMEZONE_OFFSET * 60 * 60
+
+    display_time = format_clock(local_time)
+    set_text(display.clock_digits, display_time)
+
+    # Rebuild the date string only when the date changes
+    date = (local_time.tm_year, local_time.tm_mon, local_time.tm_mday)
+    if date != clock_date:
+        weekday = WEEKDAY[local_time.tm_wday]
+        month = MONTH[local_time.tm_mon - 1]
+        day = local_time.tm_mday
+        year = local_time.tm_year
+        display.clock_day_mon_yr.text = f"{weekday}  {month} {day:02d}, {year:04d}"
+        clock_date = date
     # print(display.clock_day_mon_yr.text)
-    print(
-        f"Time: {local_time} {WEEKDAY[wday]}  {MONTH[month - 1]} {day:02d}, {year:04d}"
-    )
+    debug_print(f"Time: {display_time} {display.clock_day_mon_yr.text}")
     display.clock_icon_mask.fill = display.LCARS_LT_BLU
-    display.wifi_icon_mask.fill = display.LCARS_LT_BLU
-    pixel[0] = NORMAL  # Normal
+    end_fetch()
 
 
 def adjust_brightness():
     """Acquire the ALS-PT19 light sensor value and gradually adjust display
     brightness based on ambient light. The display brightness ranges from 0.05
     to BRIGHTNESS when the ambient light level falls between 5 and 200 lux.
-    Full-scale raw light sensor value (65535) is approximately 1500 Lux."""
-    global old_brightness
+    Full-scale raw light sensor value (65535) is approximately 1500 Lux.
+    Sensor readings are reduced to 8-bit precision (255 full-scale) and
+    smoothed with an exponential moving average."""
+    global old_brightness, light_raw
     if not LIGHT_SENSOR:
         return
+    sensor = light_sensor
     raw = 0
-    for i in range(2000):
-        raw = raw + light_sensor.value
+    for i in range(16):
+        raw = raw + (sensor.value >> 8)
+    if light_raw is None:
+        light_raw = raw / 16
+    else:
+        light_raw = light_raw + ((raw / 16) - light_raw) * 0.1
 
     target_brightness = round(
-        map_range(raw / 2000 / 65535 * 1500, 5, 200, 0.3, BRIGHTNESS), 3
+        map_range(light_raw / 255 * 1500, 5, 200, 0.3, BRIGHTNESS), 3
     )
     new_brightness = round(
         old_brightness + ((target_brightness - old_brightness) / 5), 3
@@ -279,6 +440,9 @@ pixel[0] = NORMAL  # Success
 # Initialize the weather_table and history variables
 weather_table = None
 weather_table_old = None
+last_read_time = None
+last_daylight = None  # The daylight state of the current palette
+last_icon = None  # The (description, daylight) of the current icon
 
 # Initialize a socket pool and requests session
 pixel[0] = FETCH  # Busy
@@ -295,20 +459,22 @@ pixel[0] = NORMAL  # Normal
 
 # ### PRIMARY LOOP ###
 while True:
-    print("=" * 35)
+    debug_print("=" * 35)
+
+    # Fetch the time, feed quality, and workshop conditions as one group
+    begin_fetch()
 
     # Update local time display and monitor AIO throttle limit
     update_local_time()
-    print(
-        f"Throttle Remain/Limit: {io.get_remaining_throttle_limit()}/{io.get_throttle_limit()}"
-    )
-    print("-" * 35)
+    if DEBUG:  # The throttle limit queries are extra AIO requests
+        print(
+            f"Throttle Remain/Limit: {io.get_remaining_throttle_limit()}/{io.get_throttle_limit()}"
+        )
+    debug_print("-" * 35)
 
     # Check AIO Feed Quality
     q_json = get_last_value("system-watchdog", json=True)
-    created_at_ts = (datetime.fromisoformat(q_json["created_at"]).timestamp()) + (
-        TIMEZONE_OFFSET * 60 * 60
-    )
+    created_at_ts = iso_timestamp(q_json["created_at"]) + TIMEZONE_OFFSET_SEC
     # print((0, (time.time() - created_at_ts) / 60))  # plot created time delta
 
     if time.time() - created_at_ts > 10 * 60:
@@ -317,46 +483,41 @@ while True:
         display.quality_icon_mask.fill = None
         display.alert("QUALITY WARN")
     else:
-        print("INFO: Source Quality is OK")
+        debug_print("INFO: Source Quality is OK")
         display.quality_icon_mask.fill = display.LCARS_LT_BLU
         display.alert("QUALITY OK")
 
     # Read the local temperature and humidity sensor
-    print("Workshop Conditions")
+    debug_print("Workshop Conditions")
     """Read the workshop sensor's temperature and humidity, calculate
     dew point and corrosion index, and display results."""
-    pixel[0] = FETCH  # Busy
     display.sensor_icon_mask.fill = None
 
-    # Get the sensor temperature from AIO feed
+    # Get the sensor temperature and humidity from the AIO shop group
+    shop_values = get_group_values(SHOP_GROUP)
     display.temp_mask.fill = display.BLACK
     display.dew_pt_mask.fill = display.BLACK
-    temp_f = float(get_last_value("shop.int-temperature"))
+    temp_f = float(shop_values["shop.int-temperature"])
     temp_c = round(fahrenheit_to_celsius(temp_f), 1)  # Celsius
-    display.temperature.text = f"{temp_f:.0f}°"
-    print(f"  Temp  {display.temperature.text}")
+    set_text(display.temperature, f"{temp_f:.0f}°")
+    debug_print(f"  Temp  {display.temperature.text}")
     display.temp_mask.fill = None
 
-    # Get the sensor humidity from AIO feed
     display.humid_mask.fill = display.BLACK
-    humid_pct = float(get_last_value("shop.int-humidity"))
-    display.humidity.text = f"{humid_pct:.0f}%"
-    print(f"  Humid {display.humidity.text}")
+    humid_pct = float(shop_values["shop.int-humidity"])
+    set_text(display.humidity, f"{humid_pct:.0f}%")
+    debug_print(f"  Humid {display.humidity.text}")
     display.humid_mask.fill = None
 
     # Display dew point
-    if None in (temp_c, humid_pct):
-        dew_c = None
-        dew_f = None
-    else:
-        dew_c, _ = dew_point_calc(temp_c, humid_pct)
-        dew_f = round(celsius_to_fahrenheit(dew_c), 1)
-    display.dew_point.text = f"{dew_f:.0f}°"
-    print(f"  Dew   {display.dew_point.text}")
+    dew_c, _ = dew_point_calc(temp_c, humid_pct)
+    dew_f = round(celsius_to_fahrenheit(dew_c), 1)
+    set_text(display.dew_point, f"{dew_f:.0f}°")
+    debug_print(f"  Dew   {display.dew_point.text}")
     display.dew_pt_mask.fill = None
 
     display.sensor_icon_mask.fill = display.LCARS_LT_BLU
-    pixel[0] = NORMAL  # Success
+    end_fetch()
 
     # Calculate and display corrosion index value.
     #   Turn on sensor heater when index = 2 (ALERT);
@@ -365,119 +526,141 @@ while True:
         corrosion_index = 2  # CORROSION ALERT
         display.status_icon.fill = display.RED
         display.status.color = display.BLACK
-        display.status.text = "ALERT"
+        set_text(display.status, "ALERT")
         display.alert("CORROSION ALERT")
 
     elif temp_c <= dew_c + 5:
         corrosion_index = 1  # CORROSION WARNING
         display.status_icon.fill = display.YELLOW
         display.status.color = display.RED
-        display.status.text = "WARN"
+        set_text(display.status, "WARN")
         display.alert("CORROSION WARNING")
 
     else:
         corrosion_index = 0  # NORMAL
         display.status_icon.fill = display.LT_GRN
         display.status.color = display.BLACK
-        display.status.text = "OK"
+        set_text(display.status, "OK")
         display.alert("NORMAL")
 
     display.sensor_icon_mask.fill = display.LCARS_LT_BLU
 
-    print("-" * 35)
+    debug_print("-" * 35)
 
     # Receive and update the conditions from AIO+ Weather
-    pixel[0] = FETCH  # AIO+ Weather fetch in progress (yellow)
-    display.wifi_icon_mask.fill = None
+    gc.collect()  # Free as much heap as possible for the large weather table
+    begin_fetch()  # AIO+ Weather fetch in progress (yellow)
     try:
-        while io.get_remaining_throttle_limit() <= 10:
-            pixel[0] = THROTTLE_DELAY
-            time.sleep(1)  # Wait until throttle limit increases
+        throttle_wait()
         pixel[0] = FETCH
-        weather_table = io.receive_weather(os.getenv("WEATHER_TOPIC_KEY"))
+        weather_table = io.receive_weather(WEATHER_TOPIC_KEY)
     except Exception as receive_weather_error:
         soft_reset(error=receive_weather_error, desc="AIO+ Weather")
 
     # print(weather_table)  # This is a very large json table
     # print("... weather table received ...")
-    display.wifi_icon_mask.fill = display.LCARS_LT_BLU
-    pixel[0] = NORMAL  # Success
+    end_fetch()
 
     if weather_table:
         forecast_table = weather_table["forecast_days_1"]  # for sunrise/sunset
         weather_table = weather_table["current"]  # extract a subset and reduce size
-        if weather_table != weather_table_old:
-            table_timestamp = weather_table["metadata"]["readTime"]
-            table_daylight = weather_table["daylight"]
-            display.select_palette(table_daylight)
-
-            print("Exterior Conditions")
-            display.dew_pt_mask.fill = display.BLACK
-            display.temp_mask.fill = display.BLACK
-            display.humid_mask.fill = display.BLACK
-            display.wind_mask.fill = display.BLACK
-            display.gusts_mask.fill = display.BLACK
-
-            table_desc = weather_table["conditionCode"]
-            print(f"  {table_desc}")
-            display.display_icon(table_desc, table_daylight)
-            display.ext_desc.text = table_desc
-
-            table_temp = f"{celsius_to_fahrenheit(weather_table['temperature']):.0f}"
-            display.ext_temp.text = f"{table_temp}°"
-            print(f"  Temp  {display.ext_temp.text}")
-
-            table_humid = f"{float(weather_table['humidity']) * 100:.0f}"
-            display.ext_humid.text = f"{table_humid}%"
-            print(f"  Humid {display.ext_humid.text}")
-
-            table_dew_point = f"{weather_table['temperatureDewPoint']:.0f}"
-            display.ext_dew.text = (
-                f"{celsius_to_fahrenheit(float(table_dew_point)):.0f}°"
+
+        # Unpack the displayed fields only for a new reading; compare them to watch for changes
+        read_time = weather_table["metadata"]["readTime"]
+        if read_time == last_read_time:
+            weather_fields = weather_table_old  # Same reading as last time
+        else:
+            last_read_time = read_time
+            weather_fields = (
+                weather_table["conditionCode"],
+                weather_table["daylight"],
+                weather_table["temperature"],
+                weather_table["humidity"],
+                weather_table["temperatureDewPoint"],
+                weather_table["windSpeed"],
+                weather_table["windDirection"],
+                weather_table["windGust"],
+                forecast_table["sunrise"],
+                forecast_table["sunset"],
             )
-            print(f"  Dew   {display.ext_dew.text}")
-            display.dew_pt_mask.fill = None
-            display.temp_mask.fill = None
-            display.humid_mask.fill = None
-
-            table_wind_speed = f"{weather_table['windSpeed'] * 0.6214:.0f}"
-            table_wind_dir = wind_direction(weather_table["windDirection"])
-            display.ext_wind.text = f"{table_wind_dir} {table_wind_speed}"
-            print(f"  Wind  {display.ext_wind.text} MPH")
-            display.wind_mask.fill = None
-
-            table_wind_gusts = f"{weather_table['windGust'] * 0.6214:.0f}"
-            display.ext_gusts.text = table_wind_gusts
-            print(f"  Gusts {display.ext_gusts.text} MPH")
-            display.gusts_mask.fill = None
-
-            sunrise_ts = (
-                datetime.fromisoformat(forecast_table["sunrise"]).timestamp()
-            ) + (TIMEZONE_OFFSET * 60 * 60)
-            sunrise_tt = time.localtime(sunrise_ts)
-            sunrise_hr, ampm = am_pm(sunrise_tt.tm_hour)
-            display.ext_sunrise.text = (
-                f"rise {sunrise_hr:2d}:{sunrise_tt.tm_min:02d}{ampm[0].lower()}"
+        if weather_fields != weather_table_old:
+            (
+                table_desc,
+                table_daylight,
+                table_temp_c,
+                table_humid_frac,
+                table_dew_c,
+                table_wind_kmh,
+                table_wind_heading,
+                table_gusts_kmh,
+                table_sunrise,
+                table_sunset,
+            ) = weather_fields
+            if table_daylight != last_daylight:
+                display.select_palette(table_daylight)
+                last_daylight = table_daylight
+
+            debug_print("Exterior Conditions")
+            for mask in DATA_MASKS:
+                mask.fill = display.BLACK
+
+            debug_print(f"  {table_desc}")
+            if (table_desc, table_daylight) != last_icon:
+                display.display_icon(table_desc, table_daylight)
+                last_icon = (table_desc, table_daylight)
+            set_text(display.ext_desc, table_desc)
+
+            table_temp = round(table_temp_c * 1.8 + 32)  # Fahrenheit
+            set_text(display.ext_temp, f"{table_temp}°")
+            debug_print(f"  Temp  {display.ext_temp.text}")
+
+            table_humid = round(table_humid_frac * 100)
+            set_text(display.ext_humid, f"{table_humid}%")
+            debug_print(f"  Humid {display.ext_humid.text}")
+
+            table_dew_point = round(celsius_to_fahrenheit(table_dew_c))
+            set_text(display.ext_dew, f"{table_dew_point}°")
+            debug_print(f"  Dew   {display.ext_dew.text}")
+
+            table_wind_speed = round(table_wind_kmh * KMH_TO_MPH)
+            table_wind_dir = wind_direction(table_wind_heading)
+            set_text(display.ext_wind, f"{table_wind_dir} {table_wind_speed}")
+            debug_print(f"  Wind  {display.ext_wind.text} MPH")
+
+            table_wind_gusts = round(table_gusts_kmh * KMH_TO_MPH)
+            set_text(display.ext_gusts, str(table_wind_gusts))
+            debug_print(f"  Gusts {display.ext_gusts.text} MPH")
+
+            # Sunrise and sunset are UTC ISO strings: "YYYY-MM-DDTHH:MM:SSZ"
+            sunrise_hr, ampm = am_pm((int(table_sunrise[11:13]) + TIMEZONE_OFFSET) % 24)
+            set_text(
+                display.ext_sunrise,
+                f"rise {sunrise_hr:2d}:{table_sunrise[14:16]}{ampm[0].lower()}",
             )
 
-            sunset_ts = (
-                datetime.fromisoformat(forecast_table["sunset"]).timestamp()
-            ) + (TIMEZONE_OFFSET * 60 * 60)
-            sunset_tt = time.localtime(sunset_ts)
-            sunset_hr, ampm = am_pm(sunset_tt.tm_hour)
-            display.ext_sunset.text = (
-                f"set {sunset_hr:2d}:{sunset_tt.tm_min:02d}{ampm[0].lower()}"
+            sunset_hr, ampm = am_pm((int(table_sunset[11:13]) + TIMEZONE_OFFSET) % 24)
+            set_text(
+                display.ext_sunset,
+                f"set {sunset_hr:2d}:{table_sunset[14:16]}{ampm[0].lower()}",
             )
 
-            weather_table_old = weather_table  # to watch for changes
+            for mask in DATA_MASKS:
+                mask.fill = None
+
+            weather_table_old = weather_fields  # to watch for changes
         else:
-            print("... waiting for new weather conditions")
+            debug_print("... waiting for new weather conditions")
+
+        # Release the weather tables before waiting; only weather_fields is kept
+        weather_table = None
+        forecast_table = None
+        gc.collect()
 
-        print("-" * 35)
-        print(f"NOTE CPU: {read_cpu_temp():.0f}°    Cooling fan state: {fan.value}")
-        print("...")
+        debug_print("-" * 35)
+        if DEBUG:
+            print(f"NOTE CPU: {read_cpu_temp():.0f}°    Cooling fan state: {fan.value}")
+        debug_print("...")
         busy(SAMPLE_INTERVAL)  # Wait before checking sensor and AIO Weather
     else:
-        w_topic_desc = os.getenv("WEATHER_TOPIC_DESC")
-        print(f"  ... waiting for conditions from {w_topic_desc}")
+        debug_print(f"  ... waiting for conditions from {WEATHER_TOPIC_DESC}")
         busy(10)  # Step up query rate when first starting
@@ -10,7 +10,7 @@ For the Adafruit ESP32-S3 4Mb/2Mb Feather with attached 3.5-inch TFT FeatherWing
 import board
 import fourwire
 import displayio
-import gc
+import bitmaptools
 import time
 import pwmio
 from adafruit_display_text.label import Label
@@ -22,9 +22,57 @@ from weatherkit_to_icon import kit_to_icon
 from cedargrove_palettefilter import PaletteFilter
 
 # fmt: off
-# A couple of day/month lookup tables
-WEEKDAY = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-MONTH = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec", ]
+# A couple of day/month lookup tables; shared with code.py
+WEEKDAY = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTH = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# The number of weather icon TileGrids kept loaded for reuse; each holds an open
+#   OnDiskBitmap file, so only the day and night variants of the current condition
+ICON_CACHE_SIZE = 2
+
+# Data status mask position, size, and row offsets within the shared bitmap
+DATA_MASK_X = 295
+DATA_MASK_Y = 83
+DATA_MASK_WIDTH = 20
+DATA_MASK_HEIGHT = 18
+DATA_MASK_ROWS = (0, 22, 44, 89, 111)
+
+
+class DataMask:
+    """A single data status mask row within the shared data mask bitmap.
+    Behaves like a Rect mask: setting `fill` to a color masks the row and
+    setting it to None reveals the data value beneath.
+
+    :param displayio.Bitmap bitmap: The shared two-color mask bitmap. No default.
+    :param displayio.Palette palette: The shared mask palette. No default.
+    :param int y: The row offset within the mask bitmap. No default."""
+
+    def __init__(self, bitmap, palette, y):
+        self._bitmap = bitmap
+        self._palette = palette
+        self._y = y
+        self._fill = None
+
+    @property
+    def fill(self):
+        return self._fill
+
+    @fill.setter
+    def fill(self, color):
+        if color is None:
+            index = 1  # Transparent
+        else:
+            self._palette[0] = color
+            index = 0
+        bitmaptools.fill_region(
+            self._bitmap,
+            0,
+            self._y,
+            DATA_MASK_WIDTH,
+            self._y + DATA_MASK_HEIGHT,
+            index,
+        )
+        self._fill = color
 
 
 class Display:
@@ -38,6 +86,12 @@ class Display:
         self._brightness = brightness
         self._rotation = rotation
 
+        self._alert_queue = []  # Pending alert message steps: (text, color, duration)
+        self._alert_step_end = 0  # Time when the current alert step ends
+
+        self._icon_cache = {}  # Loaded weather icon TileGrids keyed by icon file
+        self._icon_order = []  # Cached icon files, least recently used first
+
         if "2.4" in tft:
             # Instantiate the 2.4" TFT FeatherWing Display
             import adafruit_ili9341  # 2.4" TFT FeatherWing
@@ -58,6 +112,9 @@ class Display:
             self._display = adafruit_hx8357.HX8357(display_bus, width=480, height=320)
         self._display.rotation = self._rotation
 
+        # Hold display refreshes until the display group is complete
+        self._display.auto_refresh = False
+
         self.width = self._display.width
         self.height = self._display.height
 
@@ -77,11 +134,22 @@ class Display:
         self.ALERT_PALETTE = (0xff0040, 160)
         self.NIGHT_PALETTE = (self.bkg_image.pixel_shader[9], 0)
 
+        # Fixed colors; palette-derived colors are set by select_palette
+        self.RED = 0xFF0000
+        self.PINK = 0XEF5CA4
+        self.ORANGE = 0xFF8811
+        self.YELLOW = 0xFFFF00
+        self.CYAN = 0x00FFFF
+        self.VIOLET = 0x9900FF
+        self.LCARS_LT_BLU = None
+
+        # Build the day and night background palettes once
+        self._day_palette = self._filter_palette(self.DAY_PALETTE)
+        self._night_palette = self._filter_palette(self.NIGHT_PALETTE)
+
         self.select_palette(daylight=False, refresh_icons=False)
         self.image_group.append(self.bkg)
 
-        self._display.root_group = self.image_group  # Load display
-
         # Weather Description Icon; image_group[1]
         desc_icon = displayio.OnDiskBitmap("/cedar_grove_blue_120x50.bmp")
         icon = displayio.TileGrid(
@@ -92,6 +160,9 @@ class Display:
         # ### Define display graphic, label, and mask areas
 
         # ## Define masks
+        lt_blu = self.LCARS_LT_BLU
+        black = self.BLACK
+
         # Heartbeat Icon Mask
         self.clock_tick_mask = RoundRect(
             458, 297, 10, 11, 1, fill=self.VIOLET, outline=None, stroke=0
@@ -100,61 +171,79 @@ class Display:
 
         # Temp/Humid Sensor Icon Mask
         self.sensor_icon_mask = Rect(
-            370, 20, 20, 50, fill=self.LCARS_LT_BLU, outline=None, stroke=0
+            370, 20, 20, 50, fill=lt_blu, outline=None, stroke=0
         )
         self.image_group.append(self.sensor_icon_mask)
 
         # Sensor Heater Icon Mask
         self.heater_icon_mask = Rect(
-            350, 20, 22, 30, fill=self.LCARS_LT_BLU, outline=None, stroke=0
+            350, 20, 22, 30, fill=lt_blu, outline=None, stroke=0
         )
         self.image_group.append(self.heater_icon_mask)
 
         # Clock Icon Mask
         self.clock_icon_mask = Rect(
-            405, 20, 50, 50, fill=self.LCARS_LT_BLU, outline=None, stroke=0
+            405, 20, 50, 50, fill=lt_blu, outline=None, stroke=0
         )
         self.image_group.append(self.clock_icon_mask)
 
         # Fan Icon Mask
         self.fan_icon_mask = Rect(
-            318, 10, 30, 30, fill=self.LCARS_LT_BLU, outline=None, stroke=0
+            318, 10, 30, 30, fill=lt_blu, outline=None, stroke=0
         )
         self.image_group.append(self.fan_icon_mask)
 
         # Quality Icon Mask
         self.quality_icon_mask = Rect(
-            318, 45, 30, 30, fill=self.LCARS_LT_BLU, outline=None, stroke=0
+            318, 45, 30, 30, fill=lt_blu, outline=None, stroke=0
         )
         self.image_group.append(self.quality_icon_mask)
 
         # SD Icon Mask; Also Masks Battery and Speaker Icons
         self.sd_icon_mask = Rect(
-            325, 225, 85, 55, fill=self.LCARS_LT_BLU, outline=None, stroke=0
+            325, 225, 85, 55, fill=lt_blu, outline=None, stroke=0
         )
         self.image_group.append(self.sd_icon_mask)
 
         # Network Icon Mask
         self.wifi_icon_mask = Rect(
-            420, 230, 40, 50, fill=self.LCARS_LT_BLU, outline=None, stroke=0
+            420, 230, 40, 50, fill=lt_blu, outline=None, stroke=0
         )
         self.image_group.append(self.wifi_icon_mask)
 
         # Data Status Masks
-        self.temp_mask = Rect(295, 83, 20, 18, fill=self.BLACK, outline=None, stroke=0)
-        self.image_group.append(self.temp_mask)
-        self.humid_mask = Rect(295, 105, 20, 18, fill=self.BLACK, outline=None, stroke=0)
-        self.image_group.append(self.humid_mask)
-        self.dew_pt_mask = Rect(295, 127, 20, 18, fill=self.BLACK, outline=None, stroke=0)
-        self.image_group.append(self.dew_pt_mask)
-        self.wind_mask = Rect(295, 172, 20, 18, fill=self.BLACK, outline=None, stroke=0)
-        self.image_group.append(self.wind_mask)
-        self.gusts_mask = Rect(295, 194, 20, 18, fill=self.BLACK, outline=None, stroke=0)
-        self.image_group.append(self.gusts_mask)
+        #   One shared bitmap with a row per data value; 0 = masked, 1 = clear
+        data_mask_bitmap = displayio.Bitmap(
+            DATA_MASK_WIDTH, DATA_MASK_ROWS[-1] + DATA_MASK_HEIGHT, 2
+        )
+        data_mask_bitmap.fill(1)
+        data_mask_palette = displayio.Palette(2)
+        data_mask_palette[0] = black
+        data_mask_palette.make_transparent(1)
+        data_masks = [
+            DataMask(data_mask_bitmap, data_mask_palette, row) for row in DATA_MASK_ROWS
+        ]
+        for mask in data_masks:
+            mask.fill = black
+        (
+            self.temp_mask,
+            self.humid_mask,
+            self.dew_pt_mask,
+            self.wind_mask,
+            self.gusts_mask,
+        ) = data_masks
+        self.image_group.append(
+            displayio.TileGrid(
+                data_mask_bitmap,
+                pixel_shader=data_mask_palette,
+                x=DATA_MASK_X,
+                y=DATA_MASK_Y,
+            )
+        )
 
         # Corrosion Status Icon and Text
         self.status_icon = Triangle(
-            89, 155, 124, 210, 54, 210, fill=self.LCARS_LT_BLU, outline=None
+            89, 155, 124, 210, 54, 210, fill=lt_blu, outline=None
         )
         self.image_group.append(self.status_icon)
 
@@ -260,9 +349,10 @@ class Display:
         self.mode.anchored_position = (245, 302)
         self.image_group.append(self.mode)
 
-        gc.collect()
-
-        self.pcb_temp.text = f"{gc.mem_free() / 10 ** 6:.3f} Mb"
+        # Load the display once the group is complete; refresh it in one pass
+        self._display.root_group = self.image_group
+        self._display.refresh()
+        self._display.auto_refresh = True
 
         # Set backlight to brightness after initialization
         self._backlite.duty_cycle = int(self._brightness * 0xFFFF)
@@ -297,6 +387,22 @@ class Display:
         self._rotation = rot
         self.display.rotation = rot
 
+    def _filter_palette(self, lcars_palette):
+        # Filter the background palette; returns the palette and its derived
+        # (BLACK, WHITE, LT_GRN, LCARS_LT_BLU, WIND, GUSTS) colors
+        filter = PaletteFilter(self.bkg_image.pixel_shader, self.bkg_image.pixel_shader[9], lcars_palette[0],
+                               lcars_palette[1])
+        palette = filter.palette
+        colors = (
+            palette[0],  # BLACK: bkg_image palette index 0
+            palette[15],  # WHITE: 31
+            palette[12],  # LT_GRN: 24
+            palette[9],  # LCARS_LT_BLU: 18
+            palette[13],  # WIND: 25
+            palette[8],  # GUSTS: 17
+        )
+        return palette, colors
+
     def select_palette(self, daylight=True, refresh_icons=True):
         if isinstance(daylight, str):
             if daylight == "True":
@@ -304,28 +410,27 @@ class Display:
             else:
                 daylight = False
         if daylight:
-            lcars_palette = self.DAY_PALETTE
+            palette, colors = self._day_palette
         else:
-            lcars_palette = self.NIGHT_PALETTE
-
-        filter = PaletteFilter(self.bkg_image.pixel_shader, self.bkg_image.pixel_shader[9], lcars_palette[0],
-                               lcars_palette[1])
-        self.bkg.pixel_shader = filter.palette
-
-        self.BLACK = filter.palette[0]  # bkg_image palette index 0
-        self.WHITE = filter.palette[15]  # 31
-        self.RED = 0xFF0000
-        self.PINK = 0XEF5CA4
-        self.ORANGE = 0xFF8811
-        self.YELLOW = 0xFFFF00
-        self.LT_GRN = filter.palette[12]  # 24
-        self.CYAN = 0x00FFFF
-        self.LCARS_LT_BLU = filter.palette[9]  # 18
-        self.VIOLET = 0x9900FF
-        self.WIND = filter.palette[13]  # 25
-        self.GUSTS = filter.palette[8]  # 17
-
-        if refresh_icons:
+            palette, colors = self._night_palette
+
+        # Batch the background and mask color changes into a single refresh
+        auto_refresh = self._display.auto_refresh
+        self._display.auto_refresh = False
+        self.bkg.pixel_shader = palette
+
+        old_lcars_lt_blu = self.LCARS_LT_BLU
+        (
+            self.BLACK,
+            self.WHITE,
+            self.LT_GRN,
+            self.LCARS_LT_BLU,
+            self.WIND,
+            self.GUSTS,
+        ) = colors
+
+        # Recolor the icon masks only when the mask color changes
+        if refresh_icons and self.LCARS_LT_BLU != old_lcars_lt_blu:
             if self.wifi_icon_mask:
                 self.wifi_icon_mask.fill = self.LCARS_LT_BLU
             if self.clock_icon_mask:
@@ -341,6 +446,10 @@ class Display:
             if self.quality_icon_mask:
                 self.quality_icon_mask.fill = self.LCARS_LT_BLU
 
+        if auto_refresh:
+            self._display.refresh()
+            self._display.auto_refresh = True
+
     def display_icon(self, desc="Clear", daylight=True):
         if isinstance(daylight, str):
             if daylight == "True":
@@ -354,29 +463,50 @@ class Display:
         icon_file = f"/icons/{kit_to_icon[desc][1]}{icon_suffix}_v27_120x50.bmp"
         print(f"Icon filename: {icon_file}")
 
-        self.image_group.pop(1)
-        icon_image = displayio.OnDiskBitmap(icon_file)
-        icon_bg = displayio.TileGrid(
-            icon_image, pixel_shader=icon_image.pixel_shader, x=29, y=225
-        )
-        self.image_group.insert(1, icon_bg)
+        # Reuse a previously loaded icon; otherwise load it and cache it,
+        #   releasing the least recently used icon when the cache is full
+        icon_bg = self._icon_cache.get(icon_file)
+        if icon_bg is None:
+            if len(self._icon_order) >= ICON_CACHE_SIZE:
+                del self._icon_cache[self._icon_order.pop(0)]
+            icon_image = displayio.OnDiskBitmap(icon_file)
+            icon_bg = displayio.TileGrid(
+                icon_image, pixel_shader=icon_image.pixel_shader, x=29, y=225
+            )
+            self._icon_cache[icon_file] = icon_bg
+        else:
+            self._icon_order.remove(icon_file)
+        self._icon_order.append(icon_file)
+
+        # Descriptions can share an icon; a TileGrid can't be re-added to its group
+        if self.image_group[1] is icon_bg:
+            return
+        self.image_group[1] = icon_bg
 
     def alert(self, text=""):
         # Place alert message in clock message area. Default is a blank message.
+        # The blink sequence is queued and played by update_alert() without blocking.
         msg_text = text[:20]
         if msg_text == "" or msg_text is None:
-            msg_text = ""
-            self.display_message.text = msg_text
+            self._alert_queue.clear()
+            self.display_message.text = ""
         else:
             # print("ALERT: " + msg_text)
-            self.display_message.color = self.RED
-            self.display_message.text = msg_text
-            time.sleep(0.1)
-            self.display_message.color = self.YELLOW
-            time.sleep(0.1)
-            self.display_message.color = self.RED
-            time.sleep(0.1)
-            self.display_message.color = self.YELLOW
-            time.sleep(0.5)
-            self.display_message.color = None
+            self._alert_queue.append((msg_text, self.RED, 0.1))
+            self._alert_queue.append((msg_text, self.YELLOW, 0.1))
+            self._alert_queue.append((msg_text, self.RED, 0.1))
+            self._alert_queue.append((msg_text, self.YELLOW, 0.5))
+            self._alert_queue.append((msg_text, None, 0))
+            self.update_alert()
         return
+
+    def update_alert(self):
+        # Advance the queued alert blink sequence when the current step's
+        # duration has elapsed. Returns True while alert steps remain queued.
+        if self._alert_queue and time.monotonic() >= self._alert_step_end:
+            msg_text, color, duration = self._alert_queue.pop(0)
+            if msg_text != self.display_message.text:
+                self.display_message.text = msg_text
+            self.display_message.color = color
+            self._alert_step_end = time.monotonic() + duration
+        return bool(self._alert_queue)
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2025 JG for Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+"""
+am2320_burst.py
+
+An AM2320 temperature/humidity sensor that can read both values in a single
+I2C transaction. Uses its own I2C device rather than the library driver's
+internal register read.
+"""
+
+import time
+from adafruit_bus_device.i2c_device import I2CDevice
+import adafruit_am2320
+
+AM2320_DEFAULT_ADDR = 0x5C
+AM2320_CMD_READREG = 0x03
+
+
+def crc16(data):
+    """Calculate the Modbus CRC-16 used by the AM2320.
+    :param bytearray data: The bytes to check. No default."""
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            if crc & 0x0001:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+    return crc
+
+
+class AM2320Burst(adafruit_am2320.AM2320):
+    """An AM2320 sensor with a combined temperature and humidity read.
+    :param busio.I2C i2c_bus: The I2C bus the sensor is connected to. No default.
+    :param int address: The I2C address of the sensor. Defaults to 0x5C."""
+
+    def __init__(self, i2c_bus, address=AM2320_DEFAULT_ADDR):
+        super().__init__(i2c_bus, address)
+        self.burst_device = I2CDevice(i2c_bus, address, probe=False)
+        self.burst_buffer = bytearray(8)  # fn, length, 4 data bytes, CRC lo/hi
+
+    def read_temperature_humidity(self):
+        """Wake the sensor and read the humidity and temperature registers in
+        a single burst transaction. Returns temperature (Celsius) and
+        humidity (%)."""
+        result = self.burst_buffer
+        with self.burst_device as i2c:
+            try:
+                i2c.write(bytes([0x00]))  # Wake the sensor; it doesn't acknowledge
+            except OSError:
+                pass
+            time.sleep(0.01)
+            i2c.write(bytes([AM2320_CMD_READREG, 0x00, 4]))  # Registers 0x00 to 0x03
+            time.sleep(0.002)
+            i2c.readinto(result)
+        if result[0] != AM2320_CMD_READREG or result[1] != 4:
+            raise RuntimeError("I2C read failure")
+        if crc16(result[0:6]) != result[6] | (result[7] << 8):
+            raise RuntimeError("CRC failure")
+        humid_pct = ((result[2] << 8) | result[3]) / 10
+        temp_c = (((result[4] & 0x7F) << 8) | result[5]) / 10
+        if result[4] & 0x80:  # Sign bit
+            temp_c = -temp_c
+        return temp_c, humid_pct
@@ -17,6 +17,8 @@ import fourwire
 import microcontroller
 import digitalio
 import displayio
+import gc
+import json
 # import analogio  # for local sensor input
 import os
 import time
@@ -24,12 +26,14 @@ import rtc
 import ssl
 import supervisor
 import neopixel
+from micropython import const
 import adafruit_connection_manager
 import wifi
 import adafruit_requests
 from adafruit_io.adafruit_io import IO_HTTP
+from adafruit_io.adafruit_io_errors import AdafruitIO_RequestError, AdafruitIO_ThrottleError
 import adafruit_hx8357  # 3.5" TFT FeatherWing
-import adafruit_am2320  # I2C temperature/humidity sensor; indoor
+from am2320_burst import AM2320Burst  # I2C temperature/humidity sensor; indoor
 
 # import adafruit_sht31d  # I2C temperature/humidity sensor; indoor/outdoor
 import pwmio
@@ -48,19 +52,36 @@ XMIT_SENSOR:  True to read local sensor data and send to AIO feeds
 XMIT_WEATHER = True
 XMIT_SENSOR = True
 
-SAMPLE_INTERVAL = 240  # Check sensor and AIO Weather (seconds)
+SAMPLE_INTERVAL = const(240)  # Check sensor and AIO Weather (seconds)
+MPH_PER_KMH = 0.6214  # AIO+ Weather wind speed conversion factor
+
+# AIO throttle handling for publishing
+THROTTLE_RESERVE = const(10)  # Minimum remaining requests before publishing waits
+THROTTLE_MARGIN = const(2)  # Publishes left before the estimate is re-queried
+THROTTLE_MAX_AGE = const(60)  # Maximum age of the estimate (seconds)
+THROTTLE_BACKOFF_MAX = const(30)  # Maximum backoff between queries (seconds)
 
 # TFT Display Parameters
 BRIGHTNESS = 0.50
-ROTATION = 180
+ROTATION = const(180)
 
 # Cooling fan threshold
-FAN_ON_TRESHOLD_F = 100  # Degrees Fahrenheit
+FAN_ON_TRESHOLD_F = const(100)  # Degrees Fahrenheit
+
+# AIO+ Weather topic key and description
+WEATHER_TOPIC_KEY = os.getenv("WEATHER_TOPIC_KEY")
+WEATHER_TOPIC_DESC = os.getenv("WEATHER_TOPIC_DESC")
+
+# AIO+ Weather request URL and headers for receive_current_weather()
+WEATHER_URL = f"https://io.adafruit.com/api/v2/{os.getenv('AIO_USERNAME')}/integrations/weather/{WEATHER_TOPIC_KEY}"
+WEATHER_HEADERS = {"X-AIO-KEY": os.getenv("AIO_KEY")}
 
 # fmt: off
-# A couple of day/month lookup tables
+# A few day/month/compass lookup tables
 WEEKDAY = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 MONTH = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec", ]
+COMPASS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+BOOL_STR = ("False", "True")  # Feed strings for boolean values
 # fmt: on
 
 # ### Instantiate Local Peripherals
@@ -78,6 +99,9 @@ lite.duty_cycle = int(BRIGHTNESS * 0xFFFF)
 # Split the screen
 # supervisor.reset_terminal(display.width//2, display.height)
 
+# The ESP32-S3 internal CPU temperature sensor
+cpu = microcontroller.cpu
+
 # Instantiate cooling fan control (A4)
 fan = digitalio.DigitalInOut(board.A4)
 fan.direction = digitalio.Direction.OUTPUT
@@ -97,20 +121,33 @@ pixel[0] = 0xFF00FF  # Initializing (purple)
 
 # Instantiate the local corrosion sensor
 # corrosion_sensor = adafruit_sht31d.SHT31D(board.I2C())  # outdoor sensor
-corrosion_sensor = adafruit_am2320.AM2320(board.I2C())  # indoor sensor
+corrosion_sensor = AM2320Burst(board.I2C())  # indoor sensor
 corrosion_sensor.heater = False  # turn heater OFF
 
 # Initialize brightness history
 old_brightness = BRIGHTNESS
 
+# The last value sent to each AIO feed, for skipping unchanged values
+last_published = {}
+
+# Initialize the local AIO throttle limit estimate
+throttle_remaining = None  # Estimated requests remaining before throttling
+throttle_checked = 0  # Time of the last throttle limit query
+
+# The last sensor reading and its calculated values, for skipping recalculation
+last_sensor_reading = None  # (temp_c, humid_pct)
+last_sensor_values = None  # (temp_f, humid_pct, dew_f, corrosion_index)
+
 
 def read_local_sensor():
     """Update the temperature and humidity with current values,
-    calculate dew point and corrosion index"""
+    calculate dew point and corrosion index. The calculated values are reused
+    when the reading is unchanged from the previous one."""
+    global last_sensor_reading, last_sensor_values
     pixel[0] = 0xFFFF00  # Busy (yellow)
-    busy(3)  # Wait to read temperature value
+    busy(3)  # Wait for the sensor measurement cycle
     try:
-        temp_c = corrosion_sensor.temperature
+        temp_c, humid_pct = corrosion_sensor.read_temperature_humidity()
     except (Exception, OSError) as read_sensor_error:
         soft_reset(error=read_sensor_error, desc="Read Sensor")
 
@@ -120,16 +157,15 @@ def read_local_sensor():
         temp_f = round(celsius_to_fahrenheit(temp_c), 1)  # Fahrenheit
     else:
         temp_f = None
-    busy(3)  # Wait to read humidity value
-    try:
-        humid_pct = corrosion_sensor.relative_humidity
-    except Exception as read_sensor_error:
-        soft_reset(error=read_sensor_error, desc="Read Sensor")
 
     if humid_pct is not None:
         humid_pct = min(max(humid_pct, 0), 100)  # constrain value
         humid_pct = round(humid_pct, 1)
 
+    if (temp_c, humid_pct) == last_sensor_reading:
+        pixel[0] = 0x00FF00  # Success (green)
+        return last_sensor_values
+
     # Calculate dew point values
     if None in (temp_c, humid_pct):
         dew_c = None
@@ -154,14 +190,16 @@ def read_local_sensor():
         else:
             corrosion_index = 0  # NORMAL
             corrosion_sensor.heater = False  # turn heater OFF
-    return temp_f, humid_pct, dew_f, corrosion_index
+    last_sensor_reading = (temp_c, humid_pct)
+    last_sensor_values = (temp_f, humid_pct, dew_f, corrosion_index)
+    return last_sensor_values
 
 
 def read_cpu_temp():
     """Read the ESP32-S3 internal CPU temperature sensor and turn on
     fan if threshold is exceeded.
     Nominal operating range is -40C to 85C (-40F to 185F)."""
-    cpu_temp_f = celsius_to_fahrenheit(microcontroller.cpu.temperature)
+    cpu_temp_f = cpu.temperature * 1.8 + 32  # Fahrenheit
     if cpu_temp_f > FAN_ON_TRESHOLD_F:  # Turn on cooling fan if needed
         fan.value = True
     else:
@@ -197,25 +235,47 @@ def wind_direction(heading):
     :param int heading: The compass heading. No default."""
     if heading is None:
         return "--"
-    return ["N", "NE", "E", "SE", "S", "SW", "W", "NW"][
-        int(((heading + 22.5) % 360) / 45)
-    ]
+    return COMPASS[((int(heading) + 22) // 45) & 7]  # Integer-only sector index
+
+
+def throttle_wait():
+    """Count a publish or weather request against the local AIO throttle
+    estimate, re-querying AIO when the estimate is stale or close to the
+    reserve. Blinks the LED with a doubling backoff while throttled."""
+    global throttle_remaining, throttle_checked
+    if (
+        throttle_remaining is None
+        or throttle_remaining <= THROTTLE_RESERVE + THROTTLE_MARGIN
+        or time.monotonic() - throttle_checked > THROTTLE_MAX_AGE
+    ):
+        retry = 1
+        throttle_remaining = io.get_remaining_throttle_limit()
+        while throttle_remaining <= THROTTLE_RESERVE:
+            busy(min(2**retry, THROTTLE_BACKOFF_MAX))  # Blink while throttled
+            retry += 1
+            throttle_remaining = io.get_remaining_throttle_limit()
+        throttle_checked = time.monotonic()
+    throttle_remaining -= 1
 
 
 def publish_to_aio(value, feed, xmit=True):
     """Publish a value to an AIO feed, while monitoring checking the throttle
-    transaction rate. A blocking method.
+    transaction rate. A value that is unchanged since it was last sent to the
+    feed is skipped, except for the system-watchdog feed. A blocking method.
     :param union(int, float, str) value: The value to publish.
     :param str feed: The name of the AIO feed.
     :param bool xmit: True to enable transmitting to AIO. False for local display only.
     """
     pixel[0] = 0xFFFF00  # Busy (yellow)
     if value is not None:
-        if xmit:
+        if xmit and feed != "system-watchdog" and last_published.get(feed) == value:
+            print(f"SKIP '{value}' -> {feed} (unchanged)")
+            pixel[0] = 0x00FF00  # Success (green)
+        elif xmit:
             try:
-                while io.get_remaining_throttle_limit() <= 10:
-                    time.sleep(1)  # Wait until throttle limit increases
+                throttle_wait()
                 io.send_data(feed, value)
+                last_published[feed] = value
                 pixel[0] = 0x00FF00  # Success (green)
                 print(f"SEND '{value}' -> {feed}")
             except:
@@ -229,10 +289,118 @@ def publish_to_aio(value, feed, xmit=True):
         print(f"FAIL: '{value}' for {feed}")
 
 
-def busy(delay):
+def publish_group_to_aio(group, feed_values, xmit=True):
+    """Publish a batch of values to the feeds of an AIO group using a single
+    request and throttle token. Values that are None or unchanged since last
+    sent are left out of the batch. A blocking method.
+    :param str group: The AIO group key, e.g. 'shop' or 'default'.
+    :param list feed_values: A list of (value, feed) tuples. No default.
+    :param bool xmit: True to enable transmitting to AIO. False for local display only.
+    """
+    pixel[0] = 0xFFFF00  # Busy (yellow)
+    batch = []
+    for value, feed in feed_values:
+        if value is None:
+            print(f"FAIL: '{value}' for {feed}")
+        elif not xmit:
+            print(f"DISP '{value}' {feed}")
+        elif last_published.get(feed) == value:
+            print(f"SKIP '{value}' -> {feed} (unchanged)")
+        else:
+            batch.append((value, feed))
+
+    if batch:
+        try:
+            throttle_wait()
+            io.send_group_data(
+                group,
+                [{"key": feed.split(".")[-1], "value": value} for value, feed in batch],
+            )
+        except:
+            """If AIO is unavailable, a recognizable error code for a throttle query
+               is not provided; a broad exception is used to capture the error."""
+            soft_reset(error="", desc="AIO Group Publish or Throttle Query")
+        for value, feed in batch:
+            last_published[feed] = value
+            print(f"SEND '{value}' -> {feed}")
+    pixel[0] = 0x00FF00  # Success (green)
+
+
+def receive_current_weather():
+    """Fetch the AIO+ Weather record, parsing only the top-level 'current'
+    conditions object from the response stream rather than the full forecast
+    table. This reduces parsing time and peak heap use, not transfer size; the
+    remainder of the response is still read and discarded when the response
+    is closed. Returns the current conditions dictionary or None if the record
+    has no 'current' object. Raises the same AIO errors as IO_HTTP.
+    A blocking method."""
+    with requests.get(WEATHER_URL, headers=WEATHER_HEADERS, stream=True) as response:
+        if response.status_code == 429:
+            raise AdafruitIO_ThrottleError
+        if response.status_code != 200:
+            raise AdafruitIO_RequestError(response)
+        buffer = b""
+        depth = 0  # Object and array nesting depth; the record itself is 1
+        in_string = False
+        escaped = False
+        string_start = 0  # Buffer index of the current string's first byte
+        last_key = None  # The most recent string seen at the top level
+        expect_value = False  # True after the top-level 'current' key's colon
+        capture_start = -1  # Buffer index of the 'current' object's open brace
+        for chunk in response.iter_content(chunk_size=256):
+            scan = len(buffer)
+            buffer += chunk
+            while scan < len(buffer):
+                char = buffer[scan]
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == 0x5C:  # Backslash
+                        escaped = True
+                    elif char == 0x22:  # Quote
+                        in_string = False
+                        if depth == 1 and capture_start < 0:
+                            last_key = buffer[string_start:scan]
+                elif char <= 0x20:  # Whitespace
+                    pass
+                elif expect_value:
+                    if char != 0x7B:  # 'current' is not an object
+                        return None
+                    expect_value = False
+                    capture_start = scan
+                    depth += 1
+                elif char == 0x22:
+                    in_string = True
+                    string_start = scan + 1
+                elif char == 0x3A:  # Colon
+                    expect_value = depth == 1 and last_key == b"current"
+                elif char == 0x7B or char == 0x5B:  # Open brace or bracket
+                    depth += 1
+                elif char == 0x7D or char == 0x5D:  # Close brace or bracket
+                    depth -= 1
+                    if capture_start >= 0 and depth == 1:
+                        return json.loads(buffer[capture_start : scan + 1])
+                scan += 1
+            # Keep only the bytes still needed: the 'current' object or a top-level key
+            if capture_start < 0:
+                if in_string and depth == 1:
+                    buffer = buffer[string_start:]
+                    string_start = 0
+                else:
+                    buffer = b""
+    return None
+
+
+def busy(delay, blink=True):
     """An alternative 'time.sleep' function that blinks the LED once per second.
     A blocking method.
-    :param float delay: The time delay in seconds. No default."""
+    :param float delay: The time delay in seconds. No default.
+    :param bool blink: True to blink the LED during the delay. False for a
+    single sleep with the LED off. Defaults to True."""
+    if not blink:
+        led.value = False
+        time.sleep(delay)
+        return
     # neo_color = pixel[0]
     for blinks in range(int(round(delay, 0))):
         led.value = True
@@ -250,14 +418,11 @@ def update_local_time():
     except Exception as time_error:
         soft_reset(error=time_error, desc="Update Local Time")
 
-    local_time = f"{time.localtime().tm_hour:2d}:{time.localtime().tm_min:02d}"
-    wday = time.localtime().tm_wday
-    month = time.localtime().tm_mon
-    day = time.localtime().tm_mday
-    year = time.localtime().tm_year
-    print(
-        f"Time: {local_time} {WEEKDAY[wday]}  {MONTH[month - 1]} {day:02d}, {year:04d}"
-    )
+    now = time.localtime()
+    local_time = f"{now.tm_hour:2d}:{now.tm_min:02d}"
+    weekday = WEEKDAY[now.tm_wday]
+    month = MONTH[now.tm_mon - 1]
+    print(f"Time: {local_time} {weekday}  {month} {now.tm_mday:02d}, {now.tm_year:04d}")
     pixel[0] = 0x00FFFF  # Normal (green)
 
 
@@ -276,6 +441,7 @@ except Exception as wifi_access_error:
 # Initialize the weather_table and history variables
 weather_table = None
 weather_table_old = None
+last_read_time = None  # WeatherKit observation time of weather_table_old
 
 # Create an instance of the Adafruit IO HTTP client
 # https://docs.circuitpython.org/projects/adafruitio/en/stable/api.html
@@ -296,9 +462,10 @@ while True:
     print("=" * 35)
     update_local_time()
     try:
-        print(
-            f"Throttle Remain/Limit: {io.get_remaining_throttle_limit()}/{io.get_throttle_limit()}"
-        )
+        # Seed the local throttle estimate used by throttle_wait()
+        throttle_remaining = io.get_remaining_throttle_limit()
+        throttle_checked = time.monotonic()
+        print(f"Throttle Remain/Limit: {throttle_remaining}/{io.get_throttle_limit()}")
     except:
         """If AIO is unavailable, a recognizable error code for a throttle query
            is not provided; a broad exception is used to capture the error."""
@@ -311,77 +478,111 @@ while True:
     sens_heat = corrosion_sensor.heater
 
     publish_to_aio(
-        int(round(time.monotonic() / 60, 0)),
+        int(time.monotonic() // 60),
         "system-watchdog",
         xmit=XMIT_SENSOR,
     )
 
-    # Publish local sensor data
-    publish_to_aio(sens_temp, "shop.int-temperature", xmit=XMIT_SENSOR)
-    publish_to_aio(sens_humid, "shop.int-humidity", xmit=XMIT_SENSOR)
-    publish_to_aio(sens_dew_pt, "shop.int-dewpoint", xmit=XMIT_SENSOR)
-    publish_to_aio(sens_index, "shop.int-corrosion-index", xmit=XMIT_SENSOR)
-    publish_to_aio(str(sens_heat), "shop.int-sensor-heater-on", xmit=XMIT_SENSOR)
-    publish_to_aio(
-        f"{read_cpu_temp():.2f}", "shop.int-pcb-temperature", xmit=XMIT_SENSOR
+    # Publish local sensor data to the shop group in one request
+    publish_group_to_aio(
+        "shop",
+        [
+            (sens_temp, "shop.int-temperature"),
+            (sens_humid, "shop.int-humidity"),
+            (sens_dew_pt, "shop.int-dewpoint"),
+            (sens_index, "shop.int-corrosion-index"),
+            (BOOL_STR[sens_heat], "shop.int-sensor-heater-on"),
+            (f"{read_cpu_temp():.2f}", "shop.int-pcb-temperature"),
+        ],
+        xmit=XMIT_SENSOR,
     )
     print("-" * 35)
 
     # Receive and update the conditions from AIO+ Weather
     try:
         pixel[0] = 0xFFFF00  # AIO+ Weather fetch in progress (yellow)
-        while io.get_remaining_throttle_limit() <= 10:
-            time.sleep(1)  # Wait until throttle limit increases
-        weather_table = io.receive_weather(os.getenv("WEATHER_TOPIC_KEY"))
-        # print(weather_table)  # This is a very large json table
+        throttle_wait()
+        weather_table = receive_current_weather()
+        # print(weather_table)  # Current conditions only
         pixel[0] = 0x00FF00  # Success (green)
+    except AdafruitIO_ThrottleError:
+        throttle_remaining = None  # Query the throttle limit before the next request
+        weather_table = None
+        print("  AIO+ Weather request throttled")
     except:
         """If AIO is unavailable, a recognizable error code for a throttle query
            is not provided; a broad exception is used to capture the error."""
         soft_reset(error="", desc="AIO+ Weather or Throttle Query")
 
     if weather_table is not None:
-        if weather_table != weather_table_old:
-            try:
-                table_desc = weather_table["current"]["conditionCode"]
-                table_temp = (
-                    f"{celsius_to_fahrenheit(weather_table['current']['temperature']):.1f}"
-                )
-                table_humid = f"{weather_table['current']['humidity'] * 100:.1f}"
-                table_wind_speed = f"{weather_table['current']['windSpeed'] * 0.6214:.1f}"
-                table_wind_dir = wind_direction(weather_table["current"]["windDirection"])
-                table_wind_gusts = f"{weather_table['current']['windGust'] * 0.6214:.1f}"
-                table_timestamp = weather_table["current"]["metadata"]["readTime"]
-                table_daylight = weather_table["current"]["daylight"]
-
-                # Publish table data
-                publish_to_aio(
-                    int(round(time.monotonic() / 60, 0)),
-                    "system-watchdog",
-                    xmit=XMIT_WEATHER,
+        # Keep a small snapshot of the published fields; the table is released
+        try:
+            cur = weather_table
+            read_time = cur["metadata"]["readTime"]
+            if read_time == last_read_time:
+                # Same observation as last time; skip rebuilding the snapshot
+                weather_snapshot = weather_table_old
+            else:
+                mph = MPH_PER_KMH
+                weather_snapshot = (
+                    cur["conditionCode"],
+                    f"{celsius_to_fahrenheit(cur['temperature']):.1f}",
+                    f"{cur['humidity'] * 100:.1f}",
+                    f"{cur['windSpeed'] * mph:.1f}",
+                    wind_direction(cur["windDirection"]),
+                    f"{cur['windGust'] * mph:.1f}",
+                    cur["daylight"],
                 )
-                publish_to_aio(table_desc, "weather-description", xmit=XMIT_WEATHER)
-                publish_to_aio(table_humid, "weather-humidity", xmit=XMIT_WEATHER)
-                publish_to_aio(table_temp, "weather-temperature", xmit=XMIT_WEATHER)
-                publish_to_aio(table_wind_dir, "weather-winddirection", xmit=XMIT_WEATHER)
-                publish_to_aio(table_wind_gusts, "weather-windgusts", xmit=XMIT_WEATHER)
-                publish_to_aio(table_wind_speed, "weather-windspeed", xmit=XMIT_WEATHER)
-                publish_to_aio(str(table_daylight), "weather-daylight", xmit=XMIT_WEATHER)
-
-                weather_table_old = weather_table  # to watch for changes
-            except:
-                w_topic_desc = os.getenv("WEATHER_TOPIC_DESC")
-                print("  weather_table fetch ERROR:")
-                print(f"  ... waiting 30 sec for conditions from {w_topic_desc}")
-                busy(30)  # Try again in 30 seconds
+                last_read_time = read_time
+        except:
+            weather_snapshot = None
+        cur = None
+        weather_table = None
+        gc.collect()
+
+        if weather_snapshot is None:
+            print("  weather_table fetch ERROR:")
+            print(f"  ... waiting 30 sec for conditions from {WEATHER_TOPIC_DESC}")
+            busy(30)  # Try again in 30 seconds
+        elif weather_snapshot != weather_table_old:
+            (
+                table_desc,
+                table_temp,
+                table_humid,
+                table_wind_speed,
+                table_wind_dir,
+                table_wind_gusts,
+                table_daylight,
+            ) = weather_snapshot
+
+            # Publish table data
+            publish_to_aio(
+                int(time.monotonic() // 60),
+                "system-watchdog",
+                xmit=XMIT_WEATHER,
+            )
+            publish_group_to_aio(
+                "default",
+                [
+                    (table_desc, "weather-description"),
+                    (table_humid, "weather-humidity"),
+                    (table_temp, "weather-temperature"),
+                    (table_wind_dir, "weather-winddirection"),
+                    (table_wind_gusts, "weather-windgusts"),
+                    (table_wind_speed, "weather-windspeed"),
+                    (BOOL_STR[table_daylight], "weather-daylight"),
+                ],
+                xmit=XMIT_WEATHER,
+            )
+
+            weather_table_old = weather_snapshot  # to watch for changes
         else:
             print("  ... waiting for new weather conditions")
 
         print("-" * 35)
         print(f"... NOTE: Cooling fan state: {fan.value}")
         print(f"... NORMAL: next weather check in {SAMPLE_INTERVAL} sec ...")
-        busy(SAMPLE_INTERVAL)  # Wait before checking sensor and AIO Weather
+        busy(SAMPLE_INTERVAL, blink=False)  # Wait before checking sensor and AIO Weather
     else:
-        w_topic_desc = os.getenv("WEATHER_TOPIC_DESC")
-        print(f"  ... waiting 10 sec for conditions from {w_topic_desc}")
+        print(f"  ... waiting 10 sec for conditions from {WEATHER_TOPIC_DESC}")
         busy(10)  # Step up query rate when first starting
@@ -20,16 +20,16 @@ import rtc
 import ssl
 import supervisor
 import neopixel
+from micropython import const
 
-from adafruit_datetime import datetime
 import adafruit_connection_manager
 import wifi
 import adafruit_requests
 from adafruit_io.adafruit_io import IO_HTTP
 
-from cedargrove_temperaturetools.unit_converters import celsius_to_fahrenheit, fahrenheit_to_celsius
+from cedargrove_temperaturetools.unit_converters import celsius_to_fahrenheit
 from cedargrove_temperaturetools.dew_point import dew_point as dew_point_calc
-from source_display_graphics import Display
+from source_display_graphics import Display, WEEKDAY, MONTH
 
 # TFT Display Parameters
 BRIGHTNESS = 0.50
@@ -38,32 +38,31 @@ ROTATION = 180
 display = Display(rotation=ROTATION, brightness=BRIGHTNESS)
 
 # fmt: off
-# A couple of day/month lookup tables
-WEEKDAY = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-MONTH = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec", ]
+# A compass lookup table
+COMPASS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
 
 # Default colors
-BLACK   = 0x000000
-RED     = 0xFF0000
-ORANGE  = 0xFF8811
-YELLOW  = 0xFFFF00
-GREEN   = 0x00FF00
-LT_GRN  = 0x5dd82f
-CYAN    = 0x00FFFF
-BLUE    = 0x0000FF
-LT_BLUE = 0x000044
-VIOLET  = 0x9900FF
-DK_VIO  = 0x110022
-WHITE   = 0xFFFFFF
-GRAY    = 0x444455
-LCARS_LT_BLU = 0x07A2FF
+BLACK   = const(0x000000)
+RED     = const(0xFF0000)
+ORANGE  = const(0xFF8811)
+YELLOW  = const(0xFFFF00)
+GREEN   = const(0x00FF00)
+LT_GRN  = const(0x5dd82f)
+CYAN    = const(0x00FFFF)
+BLUE    = const(0x0000FF)
+LT_BLUE = const(0x000044)
+VIOLET  = const(0x9900FF)
+DK_VIO  = const(0x110022)
+WHITE   = const(0xFFFFFF)
+GRAY    = const(0x444455)
+LCARS_LT_BLU = const(0x07A2FF)
 
 # Define a few states and mode values
-STARTUP = VIOLET
-NORMAL  = LCARS_LT_BLU
-FETCH   = YELLOW
-ERROR   = RED
-THROTTLE_DELAY = GREEN
+STARTUP = const(VIOLET)
+NORMAL  = const(LCARS_LT_BLU)
+FETCH   = const(YELLOW)
+ERROR   = const(RED)
+THROTTLE_DELAY = const(GREEN)
 # fmt: on
 
 # Operating Mode
@@ -75,9 +74,18 @@ XMIT_WEATHER = False  # Send AIO+ Weather conditions to AIO feeds when in Source
 XMIT_SENSOR = False  # Send local sensor conditions to AIO feeds when in Source mode
 SAMPLE_INTERVAL = 240  # Check sensor and AIO Weather (seconds)
 SENSOR_INTERVAL = 30  # Interval (sec) for local check of sensor during busy function
+KMH_TO_MPH = 0.6214  # AIO+ Weather wind speed conversion factor
 
 # Display Mode Parameters
 
+# Local time zone name and offset from UTC (hours)
+TIMEZONE = os.getenv("TIMEZONE")
+TIMEZONE_OFFSET = os.getenv("TIMEZONE_OFFSET")
+
+# AIO+ Weather topic key and description
+WEATHER_TOPIC_KEY = os.getenv("WEATHER_TOPIC_KEY")
+WEATHER_TOPIC_DESC = os.getenv("WEATHER_TOPIC_DESC")
+
 # Internal cooling fan threshold
 FAN_ON_THRESHOLD_F = 100  # Degrees Fahrenheit
 
@@ -134,7 +142,7 @@ def read_local_sensor():
         print("FAIL: Read Sensor Error")
         print(f"  {str(read_sensor_error)}")
         print("  MCU will soft reset in 30 seconds.")
-        busy(30)
+        busy(30, minimal=True)
         supervisor.reload()  # soft reset: keeps the terminal session alive
     if temp_c is not None:
         temp_c = min(max(temp_c, -40), 85)  # constrain value
@@ -156,7 +164,7 @@ def read_local_sensor():
         print("FAIL: Read Sensor Error")
         print(f"  {str(read_sensor_error)}")
         print("  MCU will soft reset in 30 seconds.")
-        busy(30)
+        busy(30, minimal=True)
         supervisor.reload()  # soft reset: keeps the terminal session alive
     if humid_pct is not None:
         humid_pct = min(max(humid_pct, 0), 100)  # constrain value
@@ -215,6 +223,26 @@ def read_local_sensor():
     return temp_f, humid_pct, dew_f, corrosion_index
 
 
+def format_clock(local_time):
+    """Create the 12-hour clock display string.
+    :param struct_time local_time: The current local time. No default."""
+    hour = local_time.tm_hour
+    if hour > 12:
+        hour = hour - 12
+    if hour == 0:
+        hour = 12
+    return f"{hour:2d}:{local_time.tm_min:02d}"
+
+
+def set_text(label, text):
+    """Update a label's text only when it has changed to avoid needlessly
+    rebuilding the label's glyphs.
+    :param Label label: The display label. No default.
+    :param str text: The new label text. No default."""
+    if label.text != text:
+        label.text = text
+
+
 def read_cpu_temp():
     """Read the ESP32-S3 internal CPU temperature sensor and turn on
     fan if threshold is exceeded.
@@ -233,9 +261,7 @@ def wind_direction(heading):
     :param int heading: The compass heading. No default."""
     if heading is None:
         return "--"
-    return ["N", "NE", "E", "SE", "S", "SW", "W", "NW"][
-        int(((heading + 22.5) % 360) / 45)
-    ]
+    return COMPASS[((int(heading) + 22) // 45) & 7]  # Integer-only sector index
 
 
 def get_last_value(feed_key):
@@ -256,7 +282,7 @@ def get_last_value(feed_key):
         print(f"FAIL: <- {feed}")
         print(f"  {str(aio_feed_error)}")
         print("  MCU will soft reset in 30 seconds.")
-        busy(30)
+        busy(30, minimal=True)
         supervisor.reload()  # soft reset: keeps the terminal session alive
     display.wifi_icon_mask.fill = LCARS_LT_BLU
     pixel[0] = NORMAL  # Success
@@ -287,7 +313,7 @@ def publish_to_aio(value, feed, xmit=True):
                 print(f"FAIL: '{value}' -> {feed}")
                 print(f"  {str(aio_publish_error)}")
                 print("  MCU will soft reset in 30 seconds.")
-                busy(30)
+                busy(30, minimal=True)
                 supervisor.reload()  # soft reset: keeps the terminal session alive
         else:
             print(f"DISP '{value}' {feed}")
@@ -298,15 +324,23 @@ def publish_to_aio(value, feed, xmit=True):
     pixel[0] = NORMAL  # Success
 
 
-def busy(delay):
+def busy(delay, minimal=False):
     """An alternative 'time.sleep' function that blinks the LED once per second.
     Time display is updated from localtime each second. A blocking method.
-    :param float delay: The time delay in seconds. No default."""
+    :param float delay: The time delay in seconds. No default.
+    :param bool minimal: Only blink the LED; skip the display and sensor
+    updates. Used while waiting to reset after an error. Defaults to False."""
     global clock_tick
+    if minimal:
+        for blinks in range(int(round(delay, 0))):
+            led.value = not led.value
+            time.sleep(1)
+        return
+    clock_minute = None
     for blinks in range(int(round(delay, 0))):
         if blinks % SENSOR_INTERVAL == 0:
             read_local_sensor()
-        start = time.monotonic()
+        start_ns = time.monotonic_ns()
         if clock_tick:
             display.clock_tick_mask.fill = YELLOW
             led.value = True
@@ -315,20 +349,19 @@ def busy(delay):
             led.value = False
         clock_tick = not clock_tick
 
-        if time.localtime().tm_hour > 12:
-            hour = time.localtime().tm_hour - 12
-        else:
-            hour = time.localtime().tm_hour
-        if hour == 0:
-            hour = 12
-
-        local_time = f"{hour:2d}:{time.localtime().tm_min:02d}"
-        display.clock_digits.text = local_time
+        # Rebuild the clock display only when the minute changes
+        local_time = time.localtime()
+        if local_time.tm_min != clock_minute:
+            set_text(display.clock_digits, format_clock(local_time))
+            clock_minute = local_time.tm_min
 
-        display.pcb_temp.text = f"{gc.mem_free()/10**6:.3f} Mb  {read_cpu_temp():.0f}°  {SAMPLE_INTERVAL - blinks}"
+        # Update free memory and CPU temperature every 10 seconds
+        if blinks % 10 == 0:
+            free_kb = gc.mem_free() // 1000
+            display.pcb_temp.text = f"{free_kb // 1000}.{free_kb % 1000:03d} Mb  {read_cpu_temp():.0f}°  {SAMPLE_INTERVAL - blinks}"
 
-        delay = max((1 - (time.monotonic() - start)), 0)
-        time.sleep(delay)
+        delay_ns = 1000000000 - (time.monotonic_ns() - start_ns)
+        time.sleep(max(delay_ns, 0) / 1e9)
 
 
 def update_local_time():
@@ -336,30 +369,24 @@ def update_local_time():
     display.clock_icon_mask.fill = None
     display.wifi_icon_mask.fill = None
     try:
-        rtc.RTC().datetime = time.struct_time(io.receive_time(os.getenv("TIMEZONE")))
+        rtc.RTC().datetime = time.struct_time(io.receive_time(TIMEZONE))
     except Exception as time_error:
         print(f"  FAIL: Reverting to local time: {time_error}")
 
-    if time.localtime().tm_hour > 12:
-        hour = time.localtime().tm_hour - 12
-    else:
-        hour = time.localtime().tm_hour
-    if hour == 0:
-        hour = 12
-
-    local_time = f"{hour:2d}:{time.localtime().tm_min:02d}"
-    display.clock_digits.text = local_time
+    local_time = time.localtime()
+    display_time = format_clock(local_time)
+    display.clock_digits.text = display_time
 
-    wday = time.localtime().tm_wday
-    month = time.localtime().tm_mon
-    day = time.localtime().tm_mday
-    year = time.localtime().tm_year
+    wday = local_time.tm_wday
+    month = local_time.tm_mon
+    day = local_time.tm_mday
+    year = local_time.tm_year
     display.clock_day_mon_yr.text = (
         f"{WEEKDAY[wday]}  {MONTH[month - 1]} {day:02d}, {year:04d}"
     )
     print(display.clock_day_mon_yr.text)
     print(
-        f"Time: {local_time} {WEEKDAY[wday]}  {MONTH[month - 1]} {day:02d}, {year:04d}"
+        f"Time: {display_time} {WEEKDAY[wday]}  {MONTH[month - 1]} {day:02d}, {year:04d}"
     )
     display.clock_icon_mask.fill = LCARS_LT_BLU
     display.wifi_icon_mask.fill = LCARS_LT_BLU
@@ -381,7 +408,7 @@ except Exception as wifi_access_error:
     display.image_group = None
     print(f"  FAIL: WiFi connect \n    Error: {wifi_access_error}")
     print("    MCU will soft reset in 30 seconds.")
-    busy(30)
+    busy(30, minimal=True)
     supervisor.reload()  # soft reset: keeps the terminal session alive
 display.wifi_icon_mask.fill = LCARS_LT_BLU
 pixel[0] = NORMAL  # Success
@@ -406,7 +433,7 @@ except Exception as aio_client_error:
     display.image_group = None
     print(f"  FAIL: AIO HTTP client connect \n    Error: {aio_client_error}")
     print("    MCU will soft reset in 30 seconds.")
-    busy(30)
+    busy(30, minimal=True)
     supervisor.reload()  # soft reset: keeps the terminal session alive
 display.wifi_icon_mask.fill = LCARS_LT_BLU
 pixel[0] = NORMAL  # Normal
@@ -445,6 +472,7 @@ while True:
     print("-" * 35)
 
     # Receive and update the conditions from AIO+ Weather
+    gc.collect()  # Free as much heap as possible for the large weather table
     pixel[0] = FETCH  # AIO+ Weather fetch in progress (yellow)
     display.wifi_icon_mask.fill = None
     try:
@@ -452,13 +480,13 @@ while True:
             pixel[0] = THROTTLE_DELAY
             time.sleep(1)  # Wait until throttle limit increases
         pixel[0] = FETCH
-        weather_table = io.receive_weather(os.getenv("WEATHER_TOPIC_KEY"))
+        weather_table = io.receive_weather(WEATHER_TOPIC_KEY)
     except Exception as receive_weather_error:
         if NEOPIXEL: pixel[0] = ERROR  # Error (red)
         display.image_group = None
         print(f"FAIL: receive weather from AIO+ \n  {str(receive_weather_error)}")
         print("  MCU will soft reset in 30 seconds.")
-        busy(30)
+        busy(30, minimal=True)
         supervisor.reload()  # soft reset: keeps the terminal session alive
 
     # print(weather_table)  # This is a very large json table
@@ -469,31 +497,37 @@ while True:
     if weather_table:
         forecast_table = weather_table["forecast_days_1"]  # for sunrise/sunset
         weather_table = weather_table["current"]  # extract a subset and reduce size
+        gc.collect()  # Release the rest of the full weather table
         if weather_table != weather_table_old:
             table_desc = weather_table["conditionCode"]
 
-            display.temp_mask.fill = BLACK
-            table_temp = f"{celsius_to_fahrenheit(weather_table['temperature']):.0f}"
+            # Blank the exterior data while updating; masks are revealed as published
+            temp_mask = display.temp_mask
+            humid_mask = display.humid_mask
+            dew_pt_mask = display.dew_pt_mask
+            wind_mask = display.wind_mask
+            gusts_mask = display.gusts_mask
+            for mask in (temp_mask, humid_mask, dew_pt_mask, wind_mask, gusts_mask):
+                mask.fill = BLACK
+
+            # Whole-number values; formatted once for the display text
+            table_temp = round(celsius_to_fahrenheit(weather_table["temperature"]))
             display.ext_temp.text = f"{table_temp}°"
 
-            display.humid_mask.fill = BLACK
-            table_humid = f"{float(weather_table['humidity']) * 100:.0f}"
+            table_humid = round(weather_table["humidity"] * 100)
             display.ext_humid.text = f"{table_humid}%"
 
-            display.dew_pt_mask.fill = BLACK
-            table_dew_point = f"{weather_table['temperatureDewPoint']:.0f}"
-            display.ext_dew.text = (
-            f"{celsius_to_fahrenheit(float(table_dew_point)):.0f}°")
-            display.dew_pt_mask.fill = None
+            table_dew_point = round(celsius_to_fahrenheit(weather_table["temperatureDewPoint"]))
+            display.ext_dew.text = f"{table_dew_point}°"
+            dew_pt_mask.fill = None
 
-            display.wind_mask.fill = BLACK
-            table_wind_speed = f"{weather_table['windSpeed'] * 0.6214:.0f}"
+            mph = KMH_TO_MPH
+            table_wind_speed = round(weather_table["windSpeed"] * mph)
             table_wind_dir = wind_direction(weather_table["windDirection"])
             display.ext_wind.text = f"{table_wind_dir} {table_wind_speed}"
 
-            display.gusts_mask.fill = BLACK
-            table_wind_gusts = f"{weather_table['windGust'] * 0.6214:.0f}"
-            display.ext_gusts.text = table_wind_gusts
+            table_wind_gusts = round(weather_table["windGust"] * mph)
+            display.ext_gusts.text = str(table_wind_gusts)
 
             table_timestamp = weather_table["metadata"]["readTime"]
             table_daylight = weather_table["daylight"]
@@ -501,8 +535,9 @@ while True:
             display.display_icon(table_desc, table_daylight)
             display.ext_desc.text = table_desc
 
-            table_sunrise = datetime.fromisoformat(forecast_table["sunrise"]).timetuple()
-            sunrise_hr = table_sunrise.tm_hour + os.getenv("TIMEZONE_OFFSET")
+            # Sunrise and sunset are UTC ISO strings: "YYYY-MM-DDTHH:MM:SSZ"
+            table_sunrise = forecast_table["sunrise"]
+            sunrise_hr = int(table_sunrise[11:13]) + TIMEZONE_OFFSET
             if sunrise_hr < 0:
                 sunrise_hr = sunrise_hr + 24
             if sunrise_hr > 12:
@@ -510,18 +545,18 @@ while True:
             if sunrise_hr == 0:
                 sunrise_hr = 12
             display.ext_sunrise.text = (
-                f"rise {sunrise_hr:02d}:{table_sunrise.tm_min:02d}"
+                f"rise {sunrise_hr:02d}:{table_sunrise[14:16]}"
             )
 
-            table_sunset = datetime.fromisoformat(forecast_table["sunset"]).timetuple()
-            sunset_hr = table_sunset.tm_hour + os.getenv("TIMEZONE_OFFSET")
+            table_sunset = forecast_table["sunset"]
+            sunset_hr = int(table_sunset[11:13]) + TIMEZONE_OFFSET
             if sunset_hr < 0:
                 sunset_hr = sunset_hr + 24
             if sunset_hr > 12:
                 sunset_hr = sunset_hr - 12
             if sunset_hr == 0:
                 sunset_hr = 12
-            display.ext_sunset.text = f"set  {sunset_hr:02d}:{table_sunset.tm_min:02d}"
+            display.ext_sunset.text = f"set  {sunset_hr:02d}:{table_sunset[14:16]}"
 
             # Build a composite feed value
             composite_tuple = f"{str(table_daylight)},{display.ext_sunrise.text[-5:]},{display.ext_sunset.text[-5:]}"
@@ -536,14 +571,14 @@ while True:
             # fmt: off
             publish_to_aio(table_desc,       "weather-description", xmit=XMIT_WEATHER)
             publish_to_aio(table_humid,      "weather-humidity",    xmit=XMIT_WEATHER)
-            display.humid_mask.fill = None
+            humid_mask.fill = None
             publish_to_aio(table_temp,       "weather-temperature", xmit=XMIT_WEATHER)
-            display.temp_mask.fill = None
+            temp_mask.fill = None
             publish_to_aio(table_wind_dir,   "weather-winddirection", xmit=XMIT_WEATHER)
             publish_to_aio(table_wind_speed, "weather-windspeed",    xmit=XMIT_WEATHER)
-            display.wind_mask.fill = None
+            wind_mask.fill = None
             publish_to_aio(table_wind_gusts, "weather-windgusts",    xmit=XMIT_WEATHER)
-            display.gusts_mask.fill = None
+            gusts_mask.fill = None
             publish_to_aio(str(table_daylight), "weather-daylight",  xmit=XMIT_WEATHER)
             # fmt: on
 
@@ -562,6 +597,5 @@ while True:
         print("...")
         busy(SAMPLE_INTERVAL)  # Wait before checking sensor and AIO Weather
     else:
-        w_topic_desc = os.getenv("WEATHER_TOPIC_DESC")
-        print(f"  ... waiting for conditions from {w_topic_desc}")
+        print(f"  ... waiting for conditions from {WEATHER_TOPIC_DESC}")
         busy(10)  # Step up query rate when first starting
@@ -21,9 +21,9 @@ from weatherkit_to_icon import kit_to_icon
 
 
 # fmt: off
-# A couple of day/month lookup tables
-WEEKDAY = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-MONTH = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec", ]
+# A couple of day/month lookup tables; shared with code.py
+WEEKDAY = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTH = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
 
 # Default colors
 BLACK        = 0x000000
@@ -262,7 +262,8 @@ class Display:
 
         gc.collect()
 
-        self.pcb_temp.text = f"{gc.mem_free()/10**6:.3f} Mb"
+        free_kb = gc.mem_free() // 1000
+        self.pcb_temp.text = f"{free_kb // 1000}.{free_kb % 1000:03d} Mb"
 
         # Set backlight to brightness after initialization
         self._backlite.duty_cycle = int(self._brightness * 0xFFFF)
@@ -310,12 +311,11 @@ class Display:
         icon_file = f"/icons/{kit_to_icon[desc][1]}{icon_suffix}_v27_120x50.bmp"
         print(f"Icon filename: {icon_file}")
 
-        self.image_group.pop(1)
         icon_image = displayio.OnDiskBitmap(icon_file)
         icon_bg = displayio.TileGrid(
             icon_image, pixel_shader=icon_image.pixel_shader, x=29, y=225
         )
-        self.image_group.insert(1, icon_bg)
+        self.image_group[1] = icon_bg  # Replace the icon in place
 
     def alert(self, text=""):
         # Place alert message in clock message area. Default is a blank message.